@@ -10,6 +10,7 @@ import { ASTAnalyzer } from '@/core/analyzer/ASTAnalyzer.js';
 import { OpenRouterService } from '@/core/llm/OpenRouterService.js';
 import { DocumentationGenerator } from '@/core/generator/DocumentationGenerator.js';
 import { ErrorCollector } from '@/services/errors/ErrorCollector.js';
+import { getCacheManager } from '@/services/cache/CacheManager.js';
 import type { AnalyzeOptions } from '@/types/index.js';
 import type { CodeContext, LLMAnalysis } from '@/core/llm/OpenRouterService.js';
 import type { AnalysisResult } from '@/core/analyzer/ASTAnalyzer.js';
@@ -121,7 +122,10 @@ export function createAnalyzeCommand(): Command {
         
         // Step 3: Analyze AST for each file with error resilience
         spinner.start('Analyzing code structure...');
-        const analyzer = new ASTAnalyzer(errorCollector);
+        const analysisCache = config.cache.enabled
+          ? getCacheManager(config.cache.location, config.cache.ttl)
+          : undefined;
+        const analyzer = new ASTAnalyzer(errorCollector, analysisCache);
         const analyses: AnalysisResult[] = [];
         const astStartTime = Date.now();
         let successCount = 0;
@@ -160,6 +164,7 @@ export function createAnalyzeCommand(): Command {
         }
         
         const astDuration = ((Date.now() - astStartTime) / 1000).toFixed(1);
+        const astCacheStats = analyzer.getCacheStats();
         const statusText = `${successCount} ✅ | ${partialCount} ⚠️ | ${failedCount} ❌`;
         
         if (failedCount === 0) {
@@ -261,6 +266,9 @@ export function createAnalyzeCommand(): Command {
         logger.info(`    • Functions documented: ${documentation.statistics.totalFunctions}`);
         logger.info(`    • Total lines of code: ${documentation.statistics.totalLines}`);
         logger.info(`    • Average complexity: ${documentation.statistics.averageComplexity.toFixed(2)}`);
+        if (astCacheStats.hits > 0) {
+          logger.info(`    • Cached AST analyses used: ${astCacheStats.hits}/${astCacheStats.hits + astCacheStats.misses}`);
+        }
         if (cachedCount > 0) {
           logger.info(`    • Cached responses used: ${cachedCount}/${analyses.length} (${Math.round((cachedCount / analyses.length) * 100)}%)`);
         }
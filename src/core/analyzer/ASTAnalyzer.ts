@@ -5,8 +5,12 @@ import fs from 'fs-extra';
 import path from 'path';
 import { logger } from '@/utils/logger.js';
 import { ErrorCollector, type ErrorContext } from '@/services/errors/ErrorCollector.js';
+import type { CacheManager } from '@/services/cache/CacheManager.js';
 import type { FileInfo } from '@/types/index.js';
 
+// Bump when extraction logic changes so stale cached analyses are not reused
+const ANALYSIS_CACHE_VERSION = 1;
+
 export interface ASTNode {
   type: string;
   name?: string;
@@ -102,12 +106,15 @@ export class ASTAnalyzer {
   private parser: Parser;
   private pythonParser: Parser;
   private errorCollector: ErrorCollector;
+  private cache?: CacheManager;
+  private cacheStats = { hits: 0, misses: 0 };
 
-  constructor(errorCollector?: ErrorCollector) {
+  constructor(errorCollector?: ErrorCollector, cache?: CacheManager) {
     this.parser = new Parser();
     this.pythonParser = new Parser();
     this.pythonParser.setLanguage(Python);
     this.errorCollector = errorCollector || new ErrorCollector();
+    this.cache = cache;
   }
 
   /**
@@ -117,6 +124,13 @@ export class ASTAnalyzer {
     this.errorCollector = errorCollector;
   }
 
+  /**
+   * Get analysis cache hit/miss counts for this analyzer instance
+   */
+  getCacheStats(): { hits: number; misses: number } {
+    return { ...this.cacheStats };
+  }
+
   async analyzeFile(fileInfo: FileInfo, continueOnError: boolean = true): Promise<AnalysisResult> {
     const startTime = Date.now();
     logger.debug(`Analyzing file: ${fileInfo.path}`);
@@ -179,7 +193,28 @@ export class ASTAnalyzer {
         throw error;
       }
 
-      // Step 3: Parse AST with timeout
+      // Step 3: Reuse a cached analysis when the file content is unchanged
+      const cacheKey = this.cache?.generateKey(content, {
+        type: 'ast-analysis',
+        version: ANALYSIS_CACHE_VERSION,
+        filePath: fileInfo.path,
+        language: fileInfo.language,
+      });
+
+      if (this.cache && cacheKey) {
+        const cached = await this.cache.get<AnalysisResult>(cacheKey);
+        if (cached) {
+          this.cacheStats.hits++;
+          logger.debug(`Using cached analysis for ${fileInfo.path}`);
+          if (cached.analysisStatus === 'success') {
+            this.errorCollector.recordSuccess();
+          }
+          return cached;
+        }
+        this.cacheStats.misses++;
+      }
+
+      // Step 4: Parse AST with timeout
       let tree: Parser.Tree;
       let rootNode: Parser.SyntaxNode;
       
@@ -211,7 +246,7 @@ export class ASTAnalyzer {
         throw error;
       }
 
-      // Step 4: Extract information with error handling for each step
+      // Step 5: Extract information with error handling for each step
       let ast: ASTNode | undefined;
       let functions: FunctionNode[] = [];
       let classes: ClassNode[] = [];
@@ -261,7 +296,7 @@ export class ASTAnalyzer {
         logger.debug(`Failed to calculate complexity for ${fileInfo.path}: ${error}`);
       }
 
-      // Step 5: Enhanced analysis (with fallbacks)
+      // Step 6: Enhanced analysis (with fallbacks)
       let framework: FrameworkInfo | undefined;
       let patterns: string[] = [];
       let typeAnnotations = false;
@@ -318,6 +353,10 @@ export class ASTAnalyzer {
         this.errorCollector.recordSuccess();
       }
 
+      if (this.cache && cacheKey) {
+        await this.cache.set(cacheKey, result);
+      }
+
       return result;
 
     } catch (error) {
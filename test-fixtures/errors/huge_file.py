@@ -7,6 +7,7 @@ This file is artificially large to test timeout and memory handling
 # Generate a lot of repetitive code to make the file large
 import sys
 import os
+from array import array
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
@@ -19,21 +20,53 @@ class DataPoint:
     z: float = 0.0
     metadata: Optional[Dict[str, Any]] = None
 
+@dataclass
+class DataColumns:
+    """Structure-of-arrays view of a DataPoint batch (one float64 column per axis)"""
+    xs: array
+    ys: array
+    zs: array
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def metadata(self, index: int) -> Dict[str, Any]:
+        """Row metadata, derived on demand instead of stored per point"""
+        return {"index": index, "batch": index // 100}
+
+    @classmethod
+    def from_points(cls, points: List[DataPoint]) -> "DataColumns":
+        return cls(
+            array("d", [p.x for p in points]),
+            array("d", [p.y for p in points]),
+            array("d", [p.z for p in points]),
+        )
+
+def _scale(data: DataColumns, k: float) -> DataColumns:
+    """Multiply every column by k; map() over a bound float method stays in C"""
+    mul = k.__mul__
+    return DataColumns(
+        array("d", map(mul, data.xs)),
+        array("d", map(mul, data.ys)),
+        array("d", map(mul, data.zs)),
+    )
+
 class ProcessorBase(ABC):
     """Abstract base for processors"""
     
     @abstractmethod
-    def process(self, data: List[DataPoint]) -> List[DataPoint]:
+    def process(self, data: DataColumns) -> DataColumns:
         pass
 
-# Generate many similar classes to increase file size
-class Processor001(ProcessorBase):
-    def __init__(self):
-        self.name = "Processor001"
-        self.config = {"param1": 1.0, "param2": "value001"}
+# One parameterized processor replaces the former Processor001..Processor003 copies
+class ScalarProcessor(ProcessorBase):
+    def __init__(self, index: int):
+        self.name = f"Processor{index:03d}"
+        self.k = 1.0 + index / 1000
+        self.config = {"param1": float(index), "param2": f"value{index:03d}"}
     
-    def process(self, data: List[DataPoint]) -> List[DataPoint]:
-        return [DataPoint(p.x * 1.001, p.y * 1.001, p.z * 1.001) for p in data]
+    def process(self, data: DataColumns) -> DataColumns:
+        return _scale(data, self.k)
     
     def validate(self) -> bool:
         return len(self.config) > 0
@@ -41,56 +74,17 @@ class Processor001(ProcessorBase):
     def get_stats(self) -> Dict[str, Any]:
         return {"processor": self.name, "params": len(self.config)}
 
-class Processor002(ProcessorBase):
-    def __init__(self):
-        self.name = "Processor002"
-        self.config = {"param1": 2.0, "param2": "value002"}
-    
-    def process(self, data: List[DataPoint]) -> List[DataPoint]:
-        return [DataPoint(p.x * 1.002, p.y * 1.002, p.z * 1.002) for p in data]
-    
-    def validate(self) -> bool:
-        return len(self.config) > 0
-    
-    def get_stats(self) -> Dict[str, Any]:
-        return {"processor": self.name, "params": len(self.config)}
-
-class Processor003(ProcessorBase):
-    def __init__(self):
-        self.name = "Processor003"
-        self.config = {"param1": 3.0, "param2": "value003"}
-    
-    def process(self, data: List[DataPoint]) -> List[DataPoint]:
-        return [DataPoint(p.x * 1.003, p.y * 1.003, p.z * 1.003) for p in data]
-    
-    def validate(self) -> bool:
-        return len(self.config) > 0
-    
-    def get_stats(self) -> Dict[str, Any]:
-        return {"processor": self.name, "params": len(self.config)}
+def generate_test_data(size: int) -> DataColumns:
+    """Generate test data of specified size as contiguous float columns"""
+    return DataColumns(
+        xs=array("d", [i * 0.1 for i in range(size)]),
+        ys=array("d", [i * 0.2 for i in range(size)]),
+        zs=array("d", [i * 0.3 for i in range(size)]),
+    )
 
-# Continue generating similar classes...
-# This creates a very repetitive and large file
-
-def generate_test_data(size: int) -> List[DataPoint]:
-    """Generate test data of specified size"""
-    return [
-        DataPoint(
-            x=float(i * 0.1), 
-            y=float(i * 0.2), 
-            z=float(i * 0.3),
-            metadata={"index": i, "batch": i // 100}
-        ) for i in range(size)
-    ]
-
-def process_with_all_processors(data: List[DataPoint]) -> Dict[str, List[DataPoint]]:
+def process_with_all_processors(data: DataColumns) -> Dict[str, DataColumns]:
     """Process data with all available processors"""
-    processors = [
-        Processor001(),
-        Processor002(), 
-        Processor003(),
-        # Add more processors here
-    ]
+    processors = [ScalarProcessor(i) for i in range(1, 4)]
     
     results = {}
     for processor in processors:
@@ -105,35 +99,34 @@ def process_with_all_processors(data: List[DataPoint]) -> Dict[str, List[DataPoi
     return results
 
 # Generate many similar functions to increase complexity
-def analysis_function_001(data: List[DataPoint]) -> Dict[str, float]:
+def analysis_function_001(data: DataColumns) -> Dict[str, float]:
     """Analysis function 001"""
-    if not data:
+    if not len(data):
         return {}
     
-    x_values = [p.x for p in data]
-    y_values = [p.y for p in data]
-    z_values = [p.z for p in data]
+    xs, ys, zs = data.xs, data.ys, data.zs
+    n = len(xs)
     
     return {
-        "x_mean": sum(x_values) / len(x_values),
-        "y_mean": sum(y_values) / len(y_values),
-        "z_mean": sum(z_values) / len(z_values),
-        "x_max": max(x_values),
-        "y_max": max(y_values),
-        "z_max": max(z_values),
-        "x_min": min(x_values),
-        "y_min": min(y_values),
-        "z_min": min(z_values),
+        "x_mean": sum(xs) / n,
+        "y_mean": sum(ys) / n,
+        "z_mean": sum(zs) / n,
+        "x_max": max(xs),
+        "y_max": max(ys),
+        "z_max": max(zs),
+        "x_min": min(xs),
+        "y_min": min(ys),
+        "z_min": min(zs),
     }
 
-def analysis_function_002(data: List[DataPoint]) -> Dict[str, float]:
+def analysis_function_002(data: DataColumns) -> Dict[str, float]:
     """Analysis function 002 - similar but slightly different"""
-    if not data:
+    if not len(data):
         return {}
     
-    x_values = [p.x for p in data if p.x > 0]
-    y_values = [p.y for p in data if p.y > 0]
-    z_values = [p.z for p in data if p.z > 0]
+    x_values = [x for x in data.xs if x > 0]
+    y_values = [y for y in data.ys if y > 0]
+    z_values = [z for z in data.zs if z > 0]
     
     if not x_values:
         return {"error": "No positive X values"}
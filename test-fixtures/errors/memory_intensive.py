@@ -5,14 +5,16 @@ Contains large data structures and memory-consuming patterns.
 
 import sys
 import gc
+import functools
+from array import array
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
 import itertools
 
 # Large constant data structures
-HUGE_LIST = list(range(10000))
+HUGE_LIST = array("i", range(10000))  # one contiguous int32 buffer
 LARGE_DICT = {f"key_{i}": f"value_{i}" * 100 for i in range(1000)}
-MASSIVE_STRING = "x" * 50000  # 50KB string
+MASSIVE_STRING = b"x" * 50000  # 50KB payload
 
 # Memory-intensive class definitions
 class MemoryHeavyClass:
@@ -196,26 +198,26 @@ def process_large_data_streams():
             a, b = b, a + b
     
     def prime_sequence(limit):
-        """Generate prime numbers up to limit."""
-        def is_prime(num):
-            if num < 2:
-                return False
-            for i in range(2, int(num ** 0.5) + 1):
-                if num % i == 0:
-                    return False
-            return True
-        
-        return [num for num in range(2, limit) if is_prime(num)]
+        """Generate prime numbers up to limit (sieve of Eratosthenes)."""
+        if limit < 3:
+            return []
+        sieve = bytearray([1]) * limit
+        sieve[0] = sieve[1] = 0
+        for i in range(2, int(limit ** 0.5) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+        return list(itertools.compress(range(limit), sieve))
     
     # Large computations
     fibonacci_numbers = list(fibonacci_sequence(1000))
     prime_numbers = prime_sequence(10000)
+    prime_set = frozenset(prime_numbers)
     
     # Complex data transformations
     transformed_data = [
         {
             "fibonacci": fib,
-            "is_prime": fib in prime_numbers,
+            "is_prime": fib in prime_set,
             "factors": [i for i in range(1, min(fib + 1, 100)) if fib % i == 0] if fib > 0 else [],
             "hex": hex(fib),
             "binary": bin(fib),
@@ -230,6 +232,10 @@ def process_large_data_streams():
         "analysis": transformed_data
     }
 
+def _event_handler(i: int, x: Any) -> str:
+    """Shared body for MemoryLeakSimulator event handlers."""
+    return f"processed_{i}_{x}" * 100
+
 class MemoryLeakSimulator:
     """Class that might create memory leaks if not handled properly."""
     
@@ -283,11 +289,16 @@ class MemoryLeakSimulator:
             self.references.append(large_object)
             
             # Create event handlers (potential leak source)
-            self.event_handlers[f"handler_{i}"] = lambda x, i=i: f"processed_{i}_{x}" * 100
+            self.event_handlers[f"handler_{i}"] = functools.partial(_event_handler, i)
 
 def create_massive_data_structures():
     """Create extremely large data structures for stress testing."""
     
+    # Leaf strings that only depend on a small index are built once and shared
+    created_dates = [f"2024-01-{(i % 28) + 1:02d}" for i in range(15)]
+    type_names = [f"type_{t}" for t in range(10)]
+    prop_values = [f"prop_{p}" * 10 for p in range(15)]
+    
     # Massive nested comprehension
     huge_nested_data = {
         f"level_1_{i}": {
@@ -298,12 +309,9 @@ def create_massive_data_structures():
                         "data": f"content_{i}_{j}_{k}_{l}" * 25,
                         "computed": (i * 1000) + (j * 100) + (k * 10) + l,
                         "metadata": {
-                            "created": f"2024-01-{(i % 28) + 1:02d}",
-                            "type": f"type_{(j + k + l) % 10}",
-                            "properties": [
-                                f"prop_{p}" * 10 
-                                for p in range((i + j + k + l) % 15)
-                            ]
+                            "created": created_dates[i],
+                            "type": type_names[(j + k + l) % 10],
+                            "properties": prop_values[:(i + j + k + l) % 15]
                         }
                     }
                     for l in range(k % 8 + 2)
@@ -326,32 +334,21 @@ GLOBAL_MASSIVE_NESTED = create_massive_data_structures()
 class MegaClass:
     """Class with many methods and large amounts of data."""
     
+    # Results of the former method_0..method_9, served from one dispatch table
+    _METHOD_TABLE = tuple(f"method_{i}" * 100 for i in range(10))
+    
     def __init__(self):
-        for i in range(50):
-            setattr(self, f"property_{i}", [f"value_{j}" * 20 for j in range(i * 2)])
+        self._props = [[f"value_{j}" * 20 for j in range(i * 2)] for i in range(50)]
     
-    # Generate many methods dynamically (this pattern might stress parser)
-    def method_0(self): return "method_0" * 100
-    def method_1(self): return "method_1" * 100
-    def method_2(self): return "method_2" * 100
-    def method_3(self): return "method_3" * 100
-    def method_4(self): return "method_4" * 100
-    def method_5(self): return "method_5" * 100
-    def method_6(self): return "method_6" * 100
-    def method_7(self): return "method_7" * 100
-    def method_8(self): return "method_8" * 100
-    def method_9(self): return "method_9" * 100
-    # ... continuing pattern up to method_99 would be very repetitive
+    def method(self, n: int) -> str:
+        """Return the payload formerly produced by method_<n>."""
+        return self._METHOD_TABLE[n]
     
     def process_all_data(self):
         """Process all internal data."""
         results = []
-        for i in range(50):
-            prop_name = f"property_{i}"
-            if hasattr(self, prop_name):
-                prop_data = getattr(self, prop_name)
-                processed = [item.upper() for item in prop_data]
-                results.extend(processed)
+        for prop_data in self._props:
+            results.extend([item.upper() for item in prop_data])
         return results
 
 if __name__ == "__main__":
@@ -38,7 +38,7 @@ def broken_config_loader()
     return {"error": "missing colon"}
 
 # Valid class with proper methods
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """Valid user profile class."""
     username: str
@@ -81,13 +81,16 @@ def process_user_data(users: List[Dict]
 
 # Valid function that should be extractable
 def validate_email(email: str) -> bool:
-    """Validate email format (simplified)."""
-    return "@" in email and "." in email.split("@")[-1]
+    """Validate email format (simplified): an "@" with a "." after the last one."""
+    at = email.rfind("@")
+    return at != -1 and email.find(".", at + 1) != -1
 
 # SYNTAX ERROR: Invalid indentation  
 class DataProcessor:
     """Class with indentation errors."""
     
+    __slots__ = ("data", "processed")
+    
     def __init__(self):
         self.data = []
         self.processed = False
@@ -172,6 +175,8 @@ def configuration_builder():
 class FileManager:
     """Valid file manager with context manager support."""
     
+    __slots__ = ("file_path", "file_handle")
+    
     def __init__(self, file_path: Path):
         self.file_path = Path(file_path)
         self.file_handle = None
@@ -206,27 +211,32 @@ finally
 def fibonacci_generator(n: int):
     """Generate fibonacci numbers up to n."""
     a, b = 0, 1
-    count = 0
-    
-    while count < n:
+    for _ in range(n):
         yield a
         a, b = b, a + b
-        count += 1
+
+def fibonacci_list(n: int) -> List[int]:
+    """Return the first n fibonacci numbers in a preallocated list."""
+    out = [0] * n
+    a, b = 0, 1
+    for i in range(n):
+        out[i] = a
+        a, b = b, a + b
+    return out
 
 # Valid decorator
 def retry(max_attempts: int = 3):
     """Retry decorator for functions."""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            attempts = 0
-            while attempts < max_attempts:
+            for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    attempts += 1
-                    if attempts >= max_attempts:
-                        raise e
-                    print(f"Attempt {attempts} failed: {e}")
+                    if attempt == max_attempts:
+                        raise
+                    if DEBUG:
+                        print(f"Attempt {attempt} failed: {e}")
             return None
         return wrapper
     return decorator
@@ -268,7 +278,7 @@ if __name__ == "__main__":
     print(f"Processed {len(results)} items")
     
     # Test fibonacci generator
-    fib_numbers = list(fibonacci_generator(10))
+    fib_numbers = fibonacci_list(10)
     print(f"Fibonacci numbers: {fib_numbers}")
     
     # Test retry decorator
@@ -5,90 +5,89 @@ Contains deeply nested and complex structures.
 
 import os
 import sys
+import math
+import functools
+from bisect import bisect_left
 from typing import Any, Dict, List, Optional, Union
 
 # This file is designed to stress-test parsing performance
+
+# nested_conditions buckets: labels[n] applies when x exceeds exactly n thresholds
+_SIZE_THRESHOLDS = (1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000)
+_SIZE_LABELS = (
+    "small", "large 1k", "large 2k", "large 3k", "large 4k", "large 5k",
+    "large 6k", "large 7k", "large 8k", "large 9k", "very large",
+)
+
 def create_deeply_nested_structure():
     """Create a structure that might cause parsing delays."""
     
-    # Extremely nested if-else chain
+    # One binary search over the thresholds instead of a 10-deep if/else chain
     def nested_conditions(x):
-        if x > 1000:
-            if x > 2000:
-                if x > 3000:
-                    if x > 4000:
-                        if x > 5000:
-                            if x > 6000:
-                                if x > 7000:
-                                    if x > 8000:
-                                        if x > 9000:
-                                            if x > 10000:
-                                                return "very large"
-                                            else:
-                                                return "large 9k"
-                                        else:
-                                            return "large 8k"
-                                    else:
-                                        return "large 7k"
-                                else:
-                                    return "large 6k"
-                            else:
-                                return "large 5k"
-                        else:
-                            return "large 4k"
-                    else:
-                        return "large 3k"
-                else:
-                    return "large 2k"
-            else:
-                return "large 1k"
-        else:
-            return "small"
+        return _SIZE_LABELS[bisect_left(_SIZE_THRESHOLDS, x)]
     
     return nested_conditions
 
 def complex_comprehension_generator():
     """Generate complex nested comprehensions."""
     
-    # Multi-level nested list comprehensions
+    # Multi-level nested list comprehensions; the modulo filters are folded
+    # into range() steps so only surviving indices are ever generated
     result = [
         [
             [
                 {
                     'level_3_key': f"{i}_{j}_{k}",
                     'computed_value': (i * 100) + (j * 10) + k,
-                    'nested_list': [
-                        x for x in range(i + j + k) 
-                        if x % 2 == 0 and x > i and x < j * k
-                    ],
+                    'nested_list': list(range((i // 2 + 1) * 2, min(i + j + k, j * k), 2)),
                     'nested_dict': {
                         f'inner_key_{m}': {
                             'value': m * i * j * k,
                             'flag': m > (i + j + k) / 3,
-                            'deep_nested': {
-                                'level_4': {
-                                    'level_5': {
-                                        'final': m + i + j + k
-                                    }
-                                }
-                            }
+                            # level_4 -> level_5 -> final, flattened into one tuple-keyed dict
+                            'deep_nested': {('level_4', 'level_5', 'final'): m + i + j + k}
                         }
-                        for m in range(min(i, j, k) + 1)
-                        if m % 2 == 1 and m != j
+                        for m in range(1, min(i, j, k) + 1, 2)
+                        if m != j
                     }
                 }
-                for k in range(min(i, j) + 1)
-                if k % 3 == 0 and k != i
+                for k in range(0, min(i, j) + 1, 3)
+                if k != i
             ]
-            for j in range(i + 1)
-            if j % 2 == 1 and j > 0
+            for j in range(1, i + 1, 2)
         ]
-        for i in range(20)
-        if i % 4 == 0 and i > 0
+        for i in range(4, 20, 4)
     ]
     
     return result
 
+@functools.lru_cache(maxsize=None)
+def _is_potentially_prime(n):
+    """Prime check via 6k +/- 1 trial division, memoized on n."""
+    if n < 2:
+        return False
+    if n < 4:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+@functools.lru_cache(maxsize=None)
+def _is_fibonacci_like(n):
+    """n > 0 is Fibonacci iff 5n^2 + 4 or 5n^2 - 4 is a perfect square."""
+    if n <= 0:
+        return False
+    for d in (5 * n * n + 4, 5 * n * n - 4):
+        r = math.isqrt(d)
+        if r * r == d:
+            return True
+    return False
+
 class TimeoutInducingClass:
     """Class with potentially timeout-inducing methods."""
     
@@ -106,8 +105,8 @@ class TimeoutInducingClass:
                             'computed': (i ** 2) + (j ** 2) + (k ** 2) + (l ** 2),
                             'flags': {
                                 'is_even': (i + j + k + l) % 2 == 0,
-                                'is_prime': self._is_potentially_prime(i + j + k + l),
-                                'is_fibonacci': self._is_fibonacci_like(i * j * k * l)
+                                'is_prime': _is_potentially_prime(i + j + k + l),
+                                'is_fibonacci': _is_fibonacci_like(i * j * k * l)
                             }
                         }
                         for l in range(min(i, j, k) + 1)
@@ -122,73 +121,38 @@ class TimeoutInducingClass:
             for i in range(10)
             if i > 0
         }
-    
-    def _is_potentially_prime(self, n):
-        """Simple prime check (not optimized - might be slow)."""
-        if n < 2:
-            return False
-        for i in range(2, int(n ** 0.5) + 1):
-            if n % i == 0:
-                return False
-        return True
-    
-    def _is_fibonacci_like(self, n):
-        """Check if number has fibonacci-like properties."""
-        if n <= 0:
-            return False
         
-        a, b = 0, 1
-        while b < n:
-            a, b = b, a + b
-        
-        return b == n
+        # Flat ((key1, key2, key3, key4), leaf) index so walks need one loop
+        self._flat = [
+            ((key1, key2, key3, key4), value4)
+            for key1, value1 in self.mega_structure.items()
+            for key2, value2 in value1.items()
+            for key3, value3 in value2.items()
+            for key4, value4 in value3.items()
+        ]
     
     def process_with_extreme_nesting(self):
-        """Method with extreme nesting levels."""
+        """Walk the pre-indexed mega_structure leaves and yield matching values."""
         try:
-            for key1, value1 in self.mega_structure.items():
-                try:
-                    for key2, value2 in value1.items():
-                        try:
-                            for key3, value3 in value2.items():
-                                try:
-                                    for key4, value4 in value3.items():
-                                        try:
-                                            if isinstance(value4, dict):
-                                                for data_key, data_value in value4.items():
-                                                    try:
-                                                        if isinstance(data_value, list):
-                                                            for item in data_value:
-                                                                try:
-                                                                    if isinstance(item, (int, float)):
-                                                                        if item > 100:
-                                                                            yield {
-                                                                                'path': [key1, key2, key3, key4, data_key],
-                                                                                'value': item,
-                                                                                'processed': item ** 2 + item ** 0.5
-                                                                            }
-                                                                except Exception as deep_error:
-                                                                    continue
-                                                        elif isinstance(data_value, dict):
-                                                            for nested_key, nested_value in data_value.items():
-                                                                try:
-                                                                    if nested_key.startswith('is_') and nested_value:
-                                                                        yield {
-                                                                            'flag_path': [key1, key2, key3, key4, data_key, nested_key],
-                                                                            'flag_value': nested_value
-                                                                        }
-                                                                except Exception as flag_error:
-                                                                    continue
-                                                    except Exception as data_error:
-                                                        continue
-                                        except Exception as level4_error:
-                                            continue
-                                except Exception as level3_error:
-                                    continue
-                        except Exception as level2_error:
-                            continue
-                except Exception as level1_error:
+            for path, leaf in self._flat:
+                if not isinstance(leaf, dict):
                     continue
+                for data_key, data_value in leaf.items():
+                    if isinstance(data_value, list):
+                        for item in data_value:
+                            if isinstance(item, (int, float)) and item > 100:
+                                yield {
+                                    'path': [*path, data_key],
+                                    'value': item,
+                                    'processed': item ** 2 + item ** 0.5
+                                }
+                    elif isinstance(data_value, dict):
+                        for nested_key, nested_value in data_value.items():
+                            if nested_key.startswith('is_') and nested_value:
+                                yield {
+                                    'flag_path': [*path, data_key, nested_key],
+                                    'flag_value': nested_value
+                                }
         except Exception as top_error:
             return None
 
@@ -220,8 +184,15 @@ def generate_complex_lambda_expressions():
         lambda x: x if x % 2 == 0 else x + 1
     ]
     
-    # Complex function composition
+    # Complex function composition, chained once up front
+    composed = functools.reduce(lambda f, g: (lambda x: g(f(x))), operations)
+    
     def compose_all(value):
+        try:
+            return composed(value)
+        except (ZeroDivisionError, ValueError, OverflowError):
+            pass
+        # A step failed: replay one op at a time, resetting to 1 on each failure
         result = value
         for op in operations:
             try:
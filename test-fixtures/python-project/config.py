@@ -6,13 +6,15 @@ API keys, and application-specific settings.
 """
 
 import os
-from typing import Optional, Dict, Any
+import sys
+import functools
+from typing import Optional, Dict, Any, ClassVar
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppConfig:
-    """Application configuration settings."""
+    """Application configuration settings (immutable once constructed)."""
     
     # Database settings
     database_url: str = field(default_factory=lambda: os.getenv(
@@ -50,6 +52,36 @@ class AppConfig:
         "two_factor_auth": False,
     })
     
+    # First validation failure, or None; set per instance in __post_init__.
+    # Declared ClassVar so it is not a field and asdict()/from_dict() round-trip
+    _validation_error: ClassVar[Optional[str]] = None
+    
+    def __post_init__(self):
+        """Intern feature-flag keys and run the validation checks once."""
+        # Interned keys let literal lookups match on identity
+        object.__setattr__(self, "features", {
+            sys.intern(name): enabled for name, enabled in self.features.items()
+        })
+        object.__setattr__(self, "_validation_error", self._check())
+    
+    def _check(self) -> Optional[str]:
+        """
+        Run the configuration checks.
+        
+        Returns:
+            Message for the first failing check, or None if all pass
+        """
+        if self.password_min_length < 6:
+            return "Password minimum length must be at least 6"
+            
+        if self.database_pool_size < 1:
+            return "Database pool size must be at least 1"
+            
+        if self.session_timeout < 60:
+            return "Session timeout must be at least 60 seconds"
+            
+        return None
+    
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Create configuration from environment variables."""
@@ -70,15 +102,8 @@ class AppConfig:
         Raises:
             ValueError: If configuration is invalid
         """
-        if self.password_min_length < 6:
-            raise ValueError("Password minimum length must be at least 6")
-            
-        if self.database_pool_size < 1:
-            raise ValueError("Database pool size must be at least 1")
-            
-        if self.session_timeout < 60:
-            raise ValueError("Session timeout must be at least 60 seconds")
-            
+        if self._validation_error is not None:
+            raise ValueError(self._validation_error)
         return True
     
     def get_feature(self, feature_name: str) -> bool:
@@ -98,21 +123,23 @@ class AppConfig:
         return f"AppConfig({self.app_name} v{self.app_version})"
 
 
-# Global configuration instance
-_config: Optional[AppConfig] = None
+# Instance installed by set_config(); None means "build from the environment"
+_config_override: Optional[AppConfig] = None
 
 
+@functools.cache
 def get_config() -> AppConfig:
-    """Get the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = AppConfig.from_env()
-        _config.validate()
-    return _config
+    """Get the global configuration instance (built and validated once)."""
+    if _config_override is not None:
+        return _config_override
+    config = AppConfig.from_env()
+    config.validate()
+    return config
 
 
 def set_config(config: AppConfig) -> None:
     """Set the global configuration instance."""
-    global _config
+    global _config_override
     config.validate()
-    _config = config
\ No newline at end of file
+    _config_override = config
+    get_config.cache_clear()
@@ -18,6 +18,8 @@ from utils.validators import validate_email, validate_password
 from utils.helpers import format_currency, log_message
 from config import AppConfig
 
+DEFAULT_ADMIN_EMAIL = "admin@example.com"
+
 
 class Application:
     """Main application controller."""
@@ -107,11 +109,10 @@ class Application:
     def _load_initial_data(self) -> None:
         """Load initial data for the application."""
         # Create admin user if doesn't exist
-        admin = self.db.get_user_by_email("admin@example.com")
-        if not admin:
+        if not self.db.user_exists(DEFAULT_ADMIN_EMAIL):
             admin = User(
                 username="admin",
-                email="admin@example.com",
+                email=DEFAULT_ADMIN_EMAIL,
                 is_admin=True
             )
             admin.set_password("admin123")
@@ -127,7 +128,7 @@ def main():
         app.startup()
         
         # Example usage
-        if app.authenticate_user("admin@example.com", "admin123"):
+        if app.authenticate_user(DEFAULT_ADMIN_EMAIL, "admin123"):
             products = app.list_products()
             print(f"Found {len(products)} products")
             
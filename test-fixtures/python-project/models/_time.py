@@ -0,0 +1,13 @@
+"""
+Shared timestamp helpers for model classes.
+
+This module provides the ISO 8601 parser used when loading models.
+"""
+
+from datetime import datetime
+
+try:
+    # C ISO 8601 parser; much faster for bulk loads when installed
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
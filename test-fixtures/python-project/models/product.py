@@ -4,18 +4,181 @@ Product model module.
 This module defines the Product class for e-commerce functionality.
 """
 
+import hashlib
+import sqlite3
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from decimal import Decimal
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Set, Union
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from models._time import parse_datetime
+
+
+@lru_cache(maxsize=4096)
+def _sku_for(name: str, category: str) -> str:
+    """
+    Build the SKU for a name/category pair.
+    
+    SKUs are a pure function of their inputs, so repeated names are served
+    from the cache instead of re-hashing.
+    
+    Args:
+        name: Product name
+        category: Product category
+        
+    Returns:
+        Generated SKU string
+    """
+    # Create SKU from category and name
+    base = f"{category[:3]}-{name[:5]}".upper()
+    hash_suffix = hashlib.md5(f"{name}{category}".encode(), usedforsecurity=False).hexdigest()[:6]
+    return f"{base}-{hash_suffix}"
+
+
+# Quantum for rounding prices to whole cents
+_CENT = Decimal("0.01")
+
+
+def _parse_price(price: Union[int, float, str, Decimal]) -> Decimal:
+    """
+    Convert a price to a finite Decimal.
+    
+    Floats go through their shortest repr, so 1.005 and 2.675 keep the
+    value as written rather than their binary approximations.
+    
+    Args:
+        price: Price as an int, float, numeric string or Decimal
+        
+    Returns:
+        Price as a Decimal
+        
+    Raises:
+        TypeError: If price is not a supported type
+        ValueError: If price is not a finite number
+    """
+    if isinstance(price, bool) or not isinstance(price, (int, float, str, Decimal)):
+        raise TypeError(f"Price must be a number or numeric string, not {type(price).__name__}")
+    try:
+        value = price if isinstance(price, Decimal) else Decimal(str(price))
+    except InvalidOperation:
+        raise ValueError(f"Invalid price: {price!r}") from None
+    if not value.is_finite():
+        raise ValueError(f"Price must be finite: {price!r}")
+    return value
+
+
+def _to_cents(value: Decimal) -> int:
+    """
+    Round a Decimal price half up to integer cents.
+    
+    Args:
+        value: Price from _parse_price
+        
+    Returns:
+        Price in cents
+    """
+    return int(value.quantize(_CENT, ROUND_HALF_UP).scaleb(2))
+
+
+def _exact_hundredths(value: Any) -> Optional[int]:
+    """
+    Get value * 100 as an int when that needs no decimal rounding.
+    
+    Ints and floats that are exactly some k / 100 (19.99, 12.5) qualify;
+    anything else returns None so callers take the Decimal path. The
+    magnitude bound keeps k / 100 within float's 15 exact digits.
+    
+    Args:
+        value: Candidate price or percentage
+        
+    Returns:
+        Hundredths of value, or None
+    """
+    if type(value) is int:
+        return value * 100
+    if type(value) is float and -1e13 < value < 1e13:
+        hundredths = round(value * 100)
+        if hundredths / 100 == value:
+            return hundredths
+    return None
+
+
+def _price_to_cents(price: Union[int, float, str, Decimal]) -> int:
+    """
+    Convert a price to integer cents, rounding half up.
+    
+    Args:
+        price: Price as an int, float, numeric string or Decimal
+        
+    Returns:
+        Price in cents
+    """
+    cents = _exact_hundredths(price)
+    if cents is None:
+        cents = _to_cents(_parse_price(price))
+    return cents
+
+
+def _div_half_up(numerator: int, denominator: int) -> int:
+    """Integer division by a positive denominator, rounding half away from zero."""
+    if numerator >= 0:
+        return (numerator + denominator // 2) // denominator
+    return -((-numerator + denominator // 2) // denominator)
+
+
+def _discounted_cents(cents: int, percentage: Union[int, float, Decimal]) -> int:
+    """
+    Apply a percentage discount to a cent amount, rounding half up.
+    
+    Whole basis points stay in integer arithmetic; finer percentages
+    such as 33.333 are applied exactly in Decimal.
+    
+    Args:
+        cents: Price in cents
+        percentage: Discount percentage (0-100)
+        
+    Returns:
+        Discounted price in cents
+    """
+    basis_points = _exact_hundredths(percentage)
+    if basis_points is not None:
+        return _div_half_up(cents * (10000 - basis_points), 10000)
+    kept = Decimal(cents) * (100 - Decimal(str(percentage))) / 100
+    return int(kept.quantize(Decimal(1), ROUND_HALF_UP))
+
+
+class ProductAttributes:
+    """Slot-backed storage for the common product attributes."""
+    
+    __slots__ = ("color", "size", "weight", "material")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the attributes that have been set to a dictionary.
+        
+        Returns:
+            Dictionary of set attribute values
+        """
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+
+# Attribute keys stored on ProductAttributes rather than in the extras dict
+_KNOWN_ATTRIBUTES = frozenset(ProductAttributes.__slots__)
 
 
 class Product:
     """Product model for e-commerce application."""
     
+    __slots__ = (
+        "product_id", "name", "_price_cents", "_price_decimal", "category", "description", "sku",
+        "stock_quantity", "is_active", "created_at", "updated_at",
+        "tags", "attributes", "_extra_attrs",
+    )
+    
     def __init__(
         self,
         name: str,
-        price: float,
+        price: Union[float, str, Decimal],
         category: str,
         product_id: Optional[int] = None,
         description: Optional[str] = None,
@@ -42,7 +205,8 @@ class Product:
         """
         self.product_id = product_id
         self.name = name
-        self.price = Decimal(str(price))
+        self._price_cents = _price_to_cents(price)
+        self._price_decimal: Optional[Decimal] = None
         self.category = category
         self.description = description or ""
         self.sku = sku or self._generate_sku()
@@ -50,8 +214,9 @@ class Product:
         self.is_active = is_active
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
-        self.tags: List[str] = []
-        self.attributes: Dict[str, Any] = {}
+        self.tags: Set[str] = set()
+        self.attributes: Optional[ProductAttributes] = None
+        self._extra_attrs: Optional[Dict[str, Any]] = None
         
     def _generate_sku(self) -> str:
         """
@@ -60,23 +225,40 @@ class Product:
         Returns:
             Generated SKU string
         """
-        import hashlib
+        return _sku_for(self.name, self.category)
         
-        # Create SKU from category and name
-        base = f"{self.category[:3]}-{self.name[:5]}".upper()
-        hash_suffix = hashlib.md5(f"{self.name}{self.category}".encode()).hexdigest()[:6]
-        return f"{base}-{hash_suffix}"
+    @property
+    def price(self) -> Decimal:
+        """Product price, stored internally as integer cents."""
+        # Built on first read after each change, then reused
+        price = self._price_decimal
+        if price is None:
+            price = self._price_decimal = Decimal(self._price_cents).scaleb(-2)
+        return price
         
-    def update_price(self, new_price: float) -> None:
+    @price.setter
+    def price(self, value: Union[float, str, Decimal]) -> None:
+        self._price_cents = _price_to_cents(value)
+        self._price_decimal = None
+        
+    def update_price(self, new_price: Union[float, str, Decimal]) -> None:
         """
         Update product price.
         
         Args:
             new_price: New price value
         """
-        if new_price < 0:
+        cents = _exact_hundredths(new_price)
+        if cents is None:
+            # Check the sign before rounding so -0.001 is still rejected
+            value = _parse_price(new_price)
+            if value < 0:
+                raise ValueError("Price cannot be negative")
+            cents = _to_cents(value)
+        elif cents < 0:
             raise ValueError("Price cannot be negative")
-        self.price = Decimal(str(new_price))
+        self._price_cents = cents
+        self._price_decimal = None
         self.updated_at = datetime.utcnow()
         
     def adjust_stock(self, quantity: int) -> bool:
@@ -108,12 +290,32 @@ class Product:
             percentage: Discount percentage (0-100)
             
         Returns:
-            Discounted price
+            Discounted price, rounded half up to cents
+        """
+        if not 0 <= percentage <= 100:
+            raise ValueError("Discount percentage must be between 0 and 100")
+        return Decimal(_discounted_cents(self._price_cents, percentage)).scaleb(-2)
+        
+    @classmethod
+    def bulk_discount(cls, products: List["Product"], percentage: float) -> None:
+        """
+        Permanently discount many products at once.
+        
+        Prices are updated in integer cents, rounded half up, without
+        creating a Decimal per product unless the percentage has
+        fractional basis points.
+        
+        Args:
+            products: Products to reprice
+            percentage: Discount percentage (0-100)
         """
         if not 0 <= percentage <= 100:
             raise ValueError("Discount percentage must be between 0 and 100")
-        discount = self.price * Decimal(str(percentage / 100))
-        return self.price - discount
+        now = datetime.utcnow()
+        for product in products:
+            product._price_cents = _discounted_cents(product._price_cents, percentage)
+            product._price_decimal = None
+            product.updated_at = now
         
     def add_tag(self, tag: str) -> None:
         """
@@ -123,7 +325,7 @@ class Product:
             tag: Tag to add
         """
         if tag not in self.tags:
-            self.tags.append(tag)
+            self.tags.add(tag)
             self.updated_at = datetime.utcnow()
             
     def remove_tag(self, tag: str) -> bool:
@@ -137,7 +339,7 @@ class Product:
             True if tag was removed, False if not found
         """
         if tag in self.tags:
-            self.tags.remove(tag)
+            self.tags.discard(tag)
             self.updated_at = datetime.utcnow()
             return True
         return False
@@ -150,9 +352,29 @@ class Product:
             key: Attribute key
             value: Attribute value
         """
-        self.attributes[key] = value
+        self._store_attribute(key, value)
         self.updated_at = datetime.utcnow()
         
+    def _store_attribute(self, key: str, value: Any) -> None:
+        """
+        Store an attribute without touching updated_at.
+        
+        Known keys go to the slotted ProductAttributes; anything else goes
+        to a lazily created extras dict.
+        
+        Args:
+            key: Attribute key
+            value: Attribute value
+        """
+        if key in _KNOWN_ATTRIBUTES:
+            if self.attributes is None:
+                self.attributes = ProductAttributes()
+            setattr(self.attributes, key, value)
+        else:
+            if self._extra_attrs is None:
+                self._extra_attrs = {}
+            self._extra_attrs[key] = value
+        
     def get_attribute(self, key: str, default: Any = None) -> Any:
         """
         Get a custom attribute.
@@ -164,7 +386,13 @@ class Product:
         Returns:
             Attribute value or default
         """
-        return self.attributes.get(key, default)
+        if key in _KNOWN_ATTRIBUTES:
+            if self.attributes is None:
+                return default
+            return getattr(self.attributes, key, default)
+        if self._extra_attrs is None:
+            return default
+        return self._extra_attrs.get(key, default)
         
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -173,10 +401,13 @@ class Product:
         Returns:
             Dictionary containing product data
         """
+        attributes = self.attributes.to_dict() if self.attributes is not None else {}
+        if self._extra_attrs:
+            attributes.update(self._extra_attrs)
         return {
             "product_id": self.product_id,
             "name": self.name,
-            "price": float(self.price),
+            "price": self._price_cents / 100,
             "category": self.category,
             "description": self.description,
             "sku": self.sku,
@@ -184,8 +415,8 @@ class Product:
             "is_active": self.is_active,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "tags": self.tags,
-            "attributes": self.attributes
+            "tags": sorted(self.tags),
+            "attributes": attributes
         }
         
     @classmethod
@@ -211,16 +442,43 @@ class Product:
         )
         
         if "created_at" in data and data["created_at"]:
-            product.created_at = datetime.fromisoformat(data["created_at"])
+            product.created_at = parse_datetime(data["created_at"])
         if "updated_at" in data and data["updated_at"]:
-            product.updated_at = datetime.fromisoformat(data["updated_at"])
+            product.updated_at = parse_datetime(data["updated_at"])
         if "tags" in data:
-            product.tags = data["tags"]
+            product.tags = set(data["tags"])
         if "attributes" in data:
-            product.attributes = data["attributes"]
+            for key, value in data["attributes"].items():
+                product._store_attribute(key, value)
             
         return product
         
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Product":
+        """
+        Create Product instance directly from a database row.
+        
+        Args:
+            row: Row from the products table
+            
+        Returns:
+            Product instance
+        """
+        created_at = row["created_at"]
+        updated_at = row["updated_at"]
+        return cls(
+            name=row["name"],
+            price=row["price"],
+            category=row["category"],
+            product_id=row["product_id"],
+            description=row["description"],
+            sku=row["sku"],
+            stock_quantity=row["stock_quantity"],
+            is_active=row["is_active"],
+            created_at=parse_datetime(created_at) if created_at else None,
+            updated_at=parse_datetime(updated_at) if updated_at else None
+        )
+        
     def __str__(self) -> str:
         """String representation of Product."""
         return f"{self.name} (${self.price})"
@@ -5,14 +5,30 @@ This module defines the User class with authentication and authorization feature
 """
 
 import hashlib
+import hmac
 import secrets
+import sqlite3
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from models._time import parse_datetime
+
+# PBKDF2-HMAC-SHA256 work factor for password hashes
+PASSWORD_HASH_ITERATIONS = 100_000
+
 
 class User:
     """User model with authentication capabilities."""
     
+    __slots__ = (
+        "user_id", "username", "email", "is_admin", "created_at",
+        "last_login", "_password_hash", "_salt", "profile", "_is_guest",
+    )
+    
+    # Non-admin permission policy; anything not listed (delete, admin) is denied
+    _ALWAYS_ALLOWED = frozenset({"read"})
+    _WRITE_PERMS = frozenset({"write"})
+    
     def __init__(
         self,
         username: str,
@@ -35,12 +51,13 @@ class User:
         """
         self.user_id = user_id
         self.username = username
+        self._is_guest = username.startswith("guest_")
         self.email = email
         self.is_admin = is_admin
         self.created_at = created_at or datetime.utcnow()
         self.last_login = last_login
-        self._password_hash: Optional[str] = None
-        self._salt: Optional[str] = None
+        self._password_hash: Optional[bytes] = None
+        self._salt: Optional[bytes] = None
         self.profile: Dict[str, Any] = {}
         
     def set_password(self, password: str) -> None:
@@ -50,7 +67,7 @@ class User:
         Args:
             password: Plain text password
         """
-        self._salt = secrets.token_hex(32)
+        self._salt = secrets.token_bytes(32)
         self._password_hash = self._hash_password(password, self._salt)
         
     def verify_password(self, password: str) -> bool:
@@ -65,21 +82,22 @@ class User:
         """
         if not self._password_hash or not self._salt:
             return False
-        return self._hash_password(password, self._salt) == self._password_hash
+        return hmac.compare_digest(self._hash_password(password, self._salt), self._password_hash)
         
-    def _hash_password(self, password: str, salt: str) -> str:
+    def _hash_password(self, password: str, salt: bytes) -> bytes:
         """
-        Hash a password with salt using SHA-256.
+        Hash a password with salt using PBKDF2-HMAC-SHA256.
         
         Args:
             password: Plain text password
-            salt: Salt for hashing
+            salt: Raw salt bytes
             
         Returns:
-            Hashed password
+            Raw password hash digest
         """
-        combined = f"{password}{salt}".encode('utf-8')
-        return hashlib.sha256(combined).hexdigest()
+        return hashlib.pbkdf2_hmac(
+            "sha256", password.encode("utf-8"), salt, PASSWORD_HASH_ITERATIONS
+        )
         
     def update_last_login(self) -> None:
         """Update the last login timestamp."""
@@ -99,18 +117,15 @@ class User:
             return True
             
         # Check specific permissions based on user role
-        user_permissions = {
-            "read": True,
-            "write": not self.is_guest(),
-            "delete": False,
-            "admin": self.is_admin
-        }
-        
-        return user_permissions.get(permission, False)
+        if permission in User._ALWAYS_ALLOWED:
+            return True
+        if permission in User._WRITE_PERMS:
+            return not self.is_guest()
+        return False
         
     def is_guest(self) -> bool:
         """Check if user is a guest user."""
-        return self.username.startswith("guest_")
+        return self._is_guest
         
     def get_display_name(self) -> str:
         """Get user's display name."""
@@ -152,14 +167,36 @@ class User:
         )
         
         if "created_at" in data and data["created_at"]:
-            user.created_at = datetime.fromisoformat(data["created_at"])
+            user.created_at = parse_datetime(data["created_at"])
         if "last_login" in data and data["last_login"]:
-            user.last_login = datetime.fromisoformat(data["last_login"])
+            user.last_login = parse_datetime(data["last_login"])
         if "profile" in data:
             user.profile = data["profile"]
             
         return user
         
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "User":
+        """
+        Create User instance directly from a database row.
+        
+        Args:
+            row: Row from the users table
+            
+        Returns:
+            User instance
+        """
+        created_at = row["created_at"]
+        last_login = row["last_login"]
+        return cls(
+            username=row["username"],
+            email=row["email"],
+            user_id=row["user_id"],
+            is_admin=row["is_admin"],
+            created_at=parse_datetime(created_at) if created_at else None,
+            last_login=parse_datetime(last_login) if last_login else None
+        )
+        
     def __str__(self) -> str:
         """String representation of User."""
         return f"User({self.username}, {self.email})"
@@ -5,10 +5,24 @@ This module handles user authentication, session management, and authorization.
 """
 
 import hashlib
+import hmac
 import secrets
+import time
 import jwt
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
+
+from models.user import PASSWORD_HASH_ITERATIONS, User
+
+# Upper bound on tracked sessions; least recently used are evicted first
+MAX_SESSIONS = 10_000
+
+# Lifetime of password reset tokens
+PASSWORD_RESET_EXPIRY_SECONDS = 60 * 60
+
+# Permissions granted to every valid non-admin session
+_GRANTED_NON_ADMIN = frozenset({"read", "write"})
 
 
 class AuthService:
@@ -23,8 +37,14 @@ class AuthService:
         """
         self.secret_key = secret_key
         self.algorithm = "HS256"
+        # Encoded once so PyJWT does not re-encode the key on every call
+        self._signing_key = secret_key.encode("utf-8")
+        self._algorithms = [self.algorithm]
         self.token_expiry = timedelta(hours=24)
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self._token_expiry_seconds = int(self.token_expiry.total_seconds())
+        self.sessions: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._max_sessions = MAX_SESSIONS
+        self._sessions_by_user: Dict[int, Set[str]] = defaultdict(set)
         
     def login(self, email: str, password: str) -> Optional[Any]:
         """
@@ -39,7 +59,6 @@ class AuthService:
         """
         # This would normally check against database
         # For demo purposes, we'll create a mock user
-        from models.user import User
         
         # Mock authentication logic
         if email == "admin@example.com" and password == "admin123":
@@ -58,6 +77,11 @@ class AuthService:
                 "email": user.email,
                 "login_time": datetime.utcnow()
             }
+            self.sessions.move_to_end(session_token)
+            self._sessions_by_user[user.user_id].add(session_token)
+            if len(self.sessions) > self._max_sessions:
+                evicted_token, evicted = self.sessions.popitem(last=False)
+                self._drop_user_index(evicted["user_id"], evicted_token)
             
             return user
         return None
@@ -72,17 +96,26 @@ class AuthService:
         Returns:
             True if logout successful
         """
-        # Find and remove user's sessions
-        sessions_to_remove = []
-        for token, session in self.sessions.items():
-            if session.get("user_id") == user.user_id:
-                sessions_to_remove.append(token)
-                
-        for token in sessions_to_remove:
-            del self.sessions[token]
+        # Remove user's sessions via the per-user token index
+        for token in self._sessions_by_user.pop(user.user_id, ()):
+            self.sessions.pop(token, None)
             
         return True
         
+    def _drop_user_index(self, user_id: int, token: str) -> None:
+        """
+        Remove an evicted token from the per-user session index.
+        
+        Args:
+            user_id: Owner of the evicted session
+            token: Session token that is no longer tracked
+        """
+        tokens = self._sessions_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._sessions_by_user[user_id]
+        
     def create_session(self, user: Any) -> str:
         """
         Create a new session for a user.
@@ -93,15 +126,17 @@ class AuthService:
         Returns:
             Session token
         """
+        # Integer POSIX claims; PyJWT passes them through unconverted
+        now_ts = int(time.time())
         payload = {
             "user_id": user.user_id,
             "email": user.email,
             "is_admin": user.is_admin,
-            "exp": datetime.utcnow() + self.token_expiry,
-            "iat": datetime.utcnow()
+            "exp": now_ts + self._token_expiry_seconds,
+            "iat": now_ts
         }
         
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        token = jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
         return token
         
     def validate_session(self, token: str) -> Optional[Dict[str, Any]]:
@@ -115,7 +150,9 @@ class AuthService:
             Session data if valid, None otherwise
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._signing_key, algorithms=self._algorithms)
+            if token in self.sessions:
+                self.sessions.move_to_end(token)
             return payload
         except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
             return None
@@ -135,8 +172,6 @@ class AuthService:
             return None
             
         # Create new token with extended expiry
-        from models.user import User
-        
         user = User(
             user_id=session_data["user_id"],
             username=session_data.get("username", ""),
@@ -166,14 +201,7 @@ class AuthService:
             return True
             
         # Check specific permissions
-        permissions_map = {
-            "read": True,
-            "write": True,
-            "delete": False,
-            "admin": False
-        }
-        
-        return permissions_map.get(permission, False)
+        return permission in _GRANTED_NON_ADMIN
         
     def generate_password_reset_token(self, email: str) -> str:
         """
@@ -185,14 +213,15 @@ class AuthService:
         Returns:
             Password reset token
         """
+        now_ts = int(time.time())
         payload = {
             "email": email,
             "purpose": "password_reset",
-            "exp": datetime.utcnow() + timedelta(hours=1),
-            "iat": datetime.utcnow()
+            "exp": now_ts + PASSWORD_RESET_EXPIRY_SECONDS,
+            "iat": now_ts
         }
         
-        token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        token = jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
         return token
         
     def validate_password_reset_token(self, token: str) -> Optional[str]:
@@ -206,7 +235,7 @@ class AuthService:
             Email address if valid, None otherwise
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._signing_key, algorithms=self._algorithms)
             if payload.get("purpose") == "password_reset":
                 return payload.get("email")
         except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
@@ -215,7 +244,7 @@ class AuthService:
         
     def hash_password(self, password: str, salt: Optional[str] = None) -> tuple[str, str]:
         """
-        Hash a password with salt.
+        Hash a password with salt using PBKDF2-HMAC-SHA256.
         
         Args:
             password: Plain text password
@@ -227,8 +256,9 @@ class AuthService:
         if not salt:
             salt = secrets.token_hex(32)
             
-        combined = f"{password}{salt}".encode('utf-8')
-        hashed = hashlib.sha256(combined).hexdigest()
+        hashed = hashlib.pbkdf2_hmac(
+            "sha256", password.encode("utf-8"), salt.encode("utf-8"), PASSWORD_HASH_ITERATIONS
+        ).hex()
         
         return hashed, salt
         
@@ -245,4 +275,4 @@ class AuthService:
             True if password matches
         """
         test_hash, _ = self.hash_password(password, salt)
-        return test_hash == hashed
\ No newline at end of file
+        return hmac.compare_digest(test_hash, hashed)
\ No newline at end of file
@@ -5,10 +5,38 @@ This module provides database connectivity and operations for the application.
 """
 
 import sqlite3
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 
+from models.user import User
+from models.product import Product
+
+
+_UPDATE_USER_SQL = """
+    UPDATE users SET 
+        username = ?, email = ?, is_admin = ?, last_login = ?
+    WHERE user_id = ?
+"""
+
+_INSERT_USER_SQL = """
+    INSERT INTO users (username, email, is_admin, created_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+_UPDATE_PRODUCT_SQL = """
+    UPDATE products SET 
+        name = ?, price = ?, category = ?, description = ?,
+        sku = ?, stock_quantity = ?, is_active = ?, updated_at = ?
+    WHERE product_id = ?
+"""
+
+_INSERT_PRODUCT_SQL = """
+    INSERT INTO products 
+    (name, price, category, description, sku, stock_quantity, is_active)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class DatabaseService:
     """Service for database operations."""
@@ -31,8 +59,11 @@ class DatabaseService:
             
         # For simplicity, we're using SQLite
         db_path = self.database_url.replace("sqlite:///", "")
-        self.connection = sqlite3.connect(db_path)
+        self.connection = sqlite3.connect(db_path, cached_statements=256)
         self.connection.row_factory = sqlite3.Row
+        # WAL + NORMAL sync avoids a full fsync per committed write
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
         self._initialize_schema()
         
     def disconnect(self) -> None:
@@ -109,6 +140,9 @@ class DatabaseService:
         """
         Execute a database query.
         
+        Each call gets its own cursor, so results and lastrowid stay valid
+        while other queries run; the statement cache still skips re-parsing.
+        
         Args:
             query: SQL query string
             params: Query parameters
@@ -118,10 +152,7 @@ class DatabaseService:
         """
         if not self.connection:
             raise RuntimeError("Database not connected")
-        cursor = self.connection.cursor()
-        if params:
-            return cursor.execute(query, params)
-        return cursor.execute(query)
+        return self.connection.execute(query, params or ())
         
     def fetch_one(self, query: str, params: Optional[tuple] = None) -> Optional[Dict[str, Any]]:
         """
@@ -152,7 +183,27 @@ class DatabaseService:
             List of dictionaries containing row data
         """
         cursor = self.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return list(map(dict, cursor))
+        
+    def fetch_iter(self, query: str, params: Optional[tuple] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows from database one at a time.
+        
+        The iterator owns its cursor, so other queries may run while it is
+        being consumed.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            
+        Yields:
+            Dictionary containing row data
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected")
+        cursor = self.connection.execute(query, params or ())
+        for row in cursor:
+            yield dict(row)
         
     def save_user(self, user: Any) -> int:
         """
@@ -164,35 +215,56 @@ class DatabaseService:
         Returns:
             User ID
         """
-        from models.user import User
-        
         if user.user_id:
             # Update existing user
-            query = """
-                UPDATE users SET 
-                    username = ?, email = ?, is_admin = ?, last_login = ?
-                WHERE user_id = ?
-            """
-            params = (
-                user.username, user.email, user.is_admin,
-                user.last_login.isoformat() if user.last_login else None,
-                user.user_id
-            )
-            self.execute(query, params)
+            self.execute(_UPDATE_USER_SQL, self._user_update_params(user))
             return user.user_id
         else:
             # Insert new user
-            query = """
-                INSERT INTO users (username, email, is_admin, created_at)
-                VALUES (?, ?, ?, ?)
-            """
-            params = (
-                user.username, user.email, user.is_admin,
-                user.created_at.isoformat() if user.created_at else datetime.utcnow().isoformat()
-            )
-            cursor = self.execute(query, params)
+            cursor = self.execute(_INSERT_USER_SQL, self._user_insert_params(user))
             return cursor.lastrowid
             
+    def save_users(self, users: List[Any]) -> int:
+        """
+        Save many users in a single transaction.
+        
+        Args:
+            users: User objects to save
+            
+        Returns:
+            Number of users saved
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected")
+        now = datetime.utcnow().isoformat()
+        with self.transaction():
+            self.connection.executemany(
+                _UPDATE_USER_SQL,
+                (self._user_update_params(u) for u in users if u.user_id)
+            )
+            self.connection.executemany(
+                _INSERT_USER_SQL,
+                (self._user_insert_params(u, now) for u in users if not u.user_id)
+            )
+        return len(users)
+        
+    @staticmethod
+    def _user_update_params(user: Any) -> tuple:
+        """Build UPDATE parameters for a user."""
+        return (
+            user.username, user.email, user.is_admin,
+            user.last_login.isoformat() if user.last_login else None,
+            user.user_id
+        )
+        
+    @staticmethod
+    def _user_insert_params(user: Any, now: Optional[str] = None) -> tuple:
+        """Build INSERT parameters for a user."""
+        return (
+            user.username, user.email, user.is_admin,
+            user.created_at.isoformat() if user.created_at else (now or datetime.utcnow().isoformat())
+        )
+            
     def get_user_by_email(self, email: str) -> Optional[Any]:
         """
         Get user by email address.
@@ -203,16 +275,30 @@ class DatabaseService:
         Returns:
             User object or None
         """
-        from models.user import User
-        
-        data = self.fetch_one(
+        row = self.execute(
             "SELECT * FROM users WHERE email = ?",
             (email,)
-        )
-        if data:
-            return User.from_dict(data)
+        ).fetchone()
+        if row:
+            return User.from_row(row)
         return None
         
+    def user_exists(self, email: str) -> bool:
+        """
+        Check whether a user with the given email exists.
+        
+        Args:
+            email: User's email address
+            
+        Returns:
+            True if a matching user row exists
+        """
+        cursor = self.execute(
+            "SELECT 1 FROM users WHERE email = ? LIMIT 1",
+            (email,)
+        )
+        return cursor.fetchone() is not None
+        
     def save_product(self, product: Any) -> int:
         """
         Save product to database.
@@ -223,37 +309,57 @@ class DatabaseService:
         Returns:
             Product ID
         """
-        from models.product import Product
-        
         if product.product_id:
             # Update existing product
-            query = """
-                UPDATE products SET 
-                    name = ?, price = ?, category = ?, description = ?,
-                    sku = ?, stock_quantity = ?, is_active = ?, updated_at = ?
-                WHERE product_id = ?
-            """
-            params = (
-                product.name, float(product.price), product.category, product.description,
-                product.sku, product.stock_quantity, product.is_active,
-                datetime.utcnow().isoformat(), product.product_id
-            )
-            self.execute(query, params)
+            params = self._product_update_params(product, datetime.utcnow().isoformat())
+            self.execute(_UPDATE_PRODUCT_SQL, params)
             return product.product_id
         else:
             # Insert new product
-            query = """
-                INSERT INTO products 
-                (name, price, category, description, sku, stock_quantity, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            params = (
-                product.name, float(product.price), product.category, product.description,
-                product.sku, product.stock_quantity, product.is_active
-            )
-            cursor = self.execute(query, params)
+            cursor = self.execute(_INSERT_PRODUCT_SQL, self._product_insert_params(product))
             return cursor.lastrowid
             
+    def save_products(self, products: List[Any]) -> int:
+        """
+        Save many products in a single transaction.
+        
+        Args:
+            products: Product objects to save
+            
+        Returns:
+            Number of products saved
+        """
+        if not self.connection:
+            raise RuntimeError("Database not connected")
+        now = datetime.utcnow().isoformat()
+        with self.transaction():
+            self.connection.executemany(
+                _UPDATE_PRODUCT_SQL,
+                (self._product_update_params(p, now) for p in products if p.product_id)
+            )
+            self.connection.executemany(
+                _INSERT_PRODUCT_SQL,
+                (self._product_insert_params(p) for p in products if not p.product_id)
+            )
+        return len(products)
+        
+    @staticmethod
+    def _product_update_params(product: Any, updated_at: str) -> tuple:
+        """Build UPDATE parameters for a product."""
+        return (
+            product.name, float(product.price), product.category, product.description,
+            product.sku, product.stock_quantity, product.is_active,
+            updated_at, product.product_id
+        )
+        
+    @staticmethod
+    def _product_insert_params(product: Any) -> tuple:
+        """Build INSERT parameters for a product."""
+        return (
+            product.name, float(product.price), product.category, product.description,
+            product.sku, product.stock_quantity, product.is_active
+        )
+            
     def get_products(self, category: Optional[str] = None) -> List[Any]:
         """
         Get products from database.
@@ -264,8 +370,6 @@ class DatabaseService:
         Returns:
             List of Product objects
         """
-        from models.product import Product
-        
         if category:
             query = "SELECT * FROM products WHERE category = ? AND is_active = 1"
             params = (category,)
@@ -273,5 +377,5 @@ class DatabaseService:
             query = "SELECT * FROM products WHERE is_active = 1"
             params = None
             
-        data = self.fetch_all(query, params)
-        return [Product.from_dict(row) for row in data]
\ No newline at end of file
+        cursor = self.execute(query, params)
+        return [Product.from_row(row) for row in cursor]
\ No newline at end of file
@@ -4,13 +4,87 @@ Helper utilities module.
 This module provides various helper functions used throughout the application.
 """
 
+import re
 import json
+import bisect
 import hashlib
+import functools
+import itertools
+import secrets
+import time
+from collections import ChainMap
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 from decimal import Decimal
 
 
+# Fast path for the default "%Y-%m-%d" format, bypassing strptime
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# strptime directives handled by _make_date_parser, with _strptime's own patterns
+_DATE_DIRECTIVES = {
+    'Y': r'\d\d\d\d',
+    'm': r'1[0-2]|0[1-9]|[1-9]',
+    'd': r'3[01]|[12]\d|0[1-9]|[1-9]| [1-9]',
+    'H': r'2[0-3]|[0-1]\d|\d',
+    'M': r'[0-5]\d|\d',
+    'S': r'6[0-1]|[0-5]\d|\d',
+    'f': r'[0-9]{1,6}',
+}
+
+# Display symbols for format_currency; other codes are shown as "CODE "
+_CURRENCY_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥",
+}
+
+# File size units; each step is a factor of 1024 (10 bits)
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# time_ago buckets: upper bounds in seconds, then (divisor, unit) for each
+# bucket past the first; anything under a minute is rendered as "just now"
+_TIME_AGO_THRESHOLDS = (60, 3600, 86400, 604800)
+_TIME_AGO_UNITS = (
+    (60, "minute"),
+    (3600, "hour"),
+    (86400, "day"),
+    (604800, "week"),
+)
+
+# Hash constructors supported by calculate_hash
+_HASHERS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "blake2b": hashlib.blake2b,
+}
+
+
+# Maximum age in seconds of the clock reading shared by the helpers below
+_UTCNOW_TTL = 0.001
+
+# [monotonic time of last refresh, cached utcnow()]
+_LAST_NOW: List[Any] = [0.0, None]
+
+
+def _utcnow_ttl() -> datetime:
+    """
+    Get the current UTC time, refreshed at most once per _UTCNOW_TTL.
+    
+    Shared by logging, calculate_age and time_ago, which only need
+    millisecond freshness; model timestamps read the clock directly.
+    
+    Returns:
+        Naive UTC datetime
+    """
+    t = time.monotonic()
+    if _LAST_NOW[1] is None or t - _LAST_NOW[0] > _UTCNOW_TTL:
+        _LAST_NOW[:] = [t, datetime.utcnow()]
+    return _LAST_NOW[1]
+
+
 def format_currency(amount: Union[float, Decimal], currency: str = "USD") -> str:
     """
     Format a number as currency.
@@ -22,22 +96,24 @@ def format_currency(amount: Union[float, Decimal], currency: str = "USD") -> str
     Returns:
         Formatted currency string
     """
-    symbols = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "JPY": "¥",
-    }
-    
-    symbol = symbols.get(currency, currency + " ")
-    
-    # Handle Decimal type
-    if isinstance(amount, Decimal):
-        amount = float(amount)
-        
+    # 0.0 and -0.0 (or Decimal 0 and -0) are equal cache keys but format
+    # differently, so zeros skip the cache
+    if amount == 0:
+        return _format_currency(amount, currency)
+    return _format_currency_cached(amount, currency)
+
+
+def _format_currency(amount: Union[float, Decimal], currency: str) -> str:
+    """Body of format_currency."""
+    # Decimal formats natively with exact half-even rounding; no float round-trip
+    symbol = _CURRENCY_SYMBOLS.get(currency, currency + " ")
     return f"{symbol}{amount:,.2f}"
 
 
+# Typed so Decimal and float never share entries
+_format_currency_cached = functools.lru_cache(maxsize=1024, typed=True)(_format_currency)
+
+
 def log_message(message: str, level: str = "INFO") -> None:
     """
     Log a message with timestamp.
@@ -46,7 +122,8 @@ def log_message(message: str, level: str = "INFO") -> None:
         message: Message to log
         level: Log level (INFO, WARNING, ERROR, DEBUG)
     """
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    n = _utcnow_ttl()
+    timestamp = f"{n.year:04d}-{n.month:02d}-{n.day:02d} {n.hour:02d}:{n.minute:02d}:{n.second:02d}"
     print(f"[{timestamp}] [{level}] {message}")
 
 
@@ -60,9 +137,8 @@ def generate_id(prefix: str = "") -> str:
     Returns:
         Unique ID string
     """
-    import uuid
-    
-    unique_id = str(uuid.uuid4())
+    # 128 random bits as hex, without uuid4's version bits and hyphenation
+    unique_id = secrets.token_hex(16)
     if prefix:
         return f"{prefix}_{unique_id}"
     return unique_id
@@ -78,7 +154,7 @@ def calculate_age(birth_date: datetime) -> int:
     Returns:
         Age in years
     """
-    today = datetime.utcnow()
+    today = _utcnow_ttl()
     age = today.year - birth_date.year
     
     # Adjust if birthday hasn't occurred this year
@@ -99,9 +175,75 @@ def format_date(date: datetime, format_str: str = "%Y-%m-%d") -> str:
     Returns:
         Formatted date string
     """
+    # tzinfo is part of the key: aware datetimes for the same instant compare
+    # equal but render differently
+    return _format_date_cached(date, date.tzinfo, format_str)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_date_cached(date: datetime, tzinfo: Any, format_str: str) -> str:
+    """Memoized body of format_date."""
     return date.strftime(format_str)
 
 
+@functools.lru_cache(maxsize=32)
+def _make_date_parser(format_str: str) -> Optional[Callable[[str], Optional[datetime]]]:
+    """
+    Build a compiled-regex parser for a strptime format string.
+    
+    Only numeric directives (%Y %m %d %H %M %S %f) and %% are supported,
+    each at most once; other formats return None so callers use strptime.
+    
+    Args:
+        format_str: strptime-style format string
+        
+    Returns:
+        Parser returning a datetime, or None when the input does not match
+    """
+    parts = []
+    seen = set()
+    i = 0
+    while i < len(format_str):
+        char = format_str[i]
+        if char == '%':
+            directive = format_str[i + 1:i + 2]
+            if directive == '%':
+                parts.append('%')
+            elif directive in _DATE_DIRECTIVES and directive not in seen:
+                seen.add(directive)
+                parts.append(f"(?P<{directive}>{_DATE_DIRECTIVES[directive]})")
+            else:
+                return None
+            i += 2
+        elif char.isspace():
+            # strptime treats any run of format whitespace as \s+
+            while i < len(format_str) and format_str[i].isspace():
+                i += 1
+            parts.append(r'\s+')
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    pattern = re.compile(''.join(parts), re.IGNORECASE)
+    
+    def parse(date_str: str) -> Optional[datetime]:
+        m = pattern.fullmatch(date_str)
+        if not m:
+            return None
+        g = m.groupdict()
+        fraction = g.get('f')
+        return datetime(
+            int(g.get('Y') or 1900),
+            int(g.get('m') or 1),
+            int(g.get('d') or 1),
+            int(g.get('H') or 0),
+            int(g.get('M') or 0),
+            int(g.get('S') or 0),
+            int(fraction.ljust(6, '0')) if fraction else 0,
+        )
+    
+    return parse
+
+
 def parse_date(date_str: str, format_str: str = "%Y-%m-%d") -> Optional[datetime]:
     """
     Parse a date string to datetime.
@@ -114,6 +256,17 @@ def parse_date(date_str: str, format_str: str = "%Y-%m-%d") -> Optional[datetime
         Parsed datetime or None if invalid
     """
     try:
+        if format_str == "%Y-%m-%d":
+            m = _ISO_DATE_RE.fullmatch(date_str)
+            if m:
+                return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        else:
+            parser = _make_date_parser(format_str)
+            if parser is not None:
+                parsed = parser(date_str)
+                if parsed is not None:
+                    return parsed
+        # Unsupported format or no match: strptime decides (and raises on bad input)
         return datetime.strptime(date_str, format_str)
     except (ValueError, TypeError):
         return None
@@ -166,10 +319,25 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
     """
     result = {}
     for d in dicts:
-        result.update(d)
+        result |= d
     return result
 
 
+def merge_dicts_view(*dicts: Dict[str, Any]) -> ChainMap:
+    """
+    Build a read-only-style merged view without copying any keys.
+    
+    Later dictionaries take precedence, matching merge_dicts.
+    
+    Args:
+        *dicts: Dictionaries to merge
+        
+    Returns:
+        ChainMap over the given dictionaries
+    """
+    return ChainMap(*reversed(dicts))
+
+
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     """
     Split a list into chunks.
@@ -184,6 +352,25 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Lazily split any iterable into chunks.
+    
+    Unlike chunk_list, nothing beyond the current chunk is materialized,
+    so this suits large or one-shot inputs such as generators.
+    
+    Args:
+        items: Iterable to split
+        chunk_size: Size of each chunk
+        
+    Yields:
+        Lists of up to chunk_size items
+    """
+    it = iter(items)
+    while batch := list(itertools.islice(it, chunk_size)):
+        yield batch
+
+
 def flatten_list(nested_list: List[List[Any]]) -> List[Any]:
     """
     Flatten a nested list.
@@ -194,7 +381,7 @@ def flatten_list(nested_list: List[List[Any]]) -> List[Any]:
     Returns:
         Flattened list
     """
-    return [item for sublist in nested_list for item in sublist]
+    return list(itertools.chain.from_iterable(nested_list))
 
 
 def remove_duplicates(lst: List[Any]) -> List[Any]:
@@ -207,35 +394,29 @@ def remove_duplicates(lst: List[Any]) -> List[Any]:
     Returns:
         List without duplicates
     """
-    seen = set()
-    result = []
-    for item in lst:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # dicts keep insertion order, so fromkeys dedupes in one C-level pass
+    return list(dict.fromkeys(lst))
 
 
+@functools.lru_cache(maxsize=4096)
 def calculate_hash(data: str, algorithm: str = "sha256") -> str:
     """
     Calculate hash of data.
     
+    Results are memoized, so repeated inputs skip rehashing.
+    
     Args:
         data: Data to hash
-        algorithm: Hash algorithm to use
+        algorithm: Hash algorithm to use (md5, sha1, sha256, blake2b)
         
     Returns:
         Hex digest of hash
     """
-    if algorithm == "md5":
-        hasher = hashlib.md5()
-    elif algorithm == "sha1":
-        hasher = hashlib.sha1()
-    elif algorithm == "sha256":
-        hasher = hashlib.sha256()
-    else:
+    hasher_factory = _HASHERS.get(algorithm)
+    if hasher_factory is None:
         raise ValueError(f"Unsupported algorithm: {algorithm}")
         
+    hasher = hasher_factory()
     hasher.update(data.encode('utf-8'))
     return hasher.hexdigest()
 
@@ -250,11 +431,29 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    # -0.0 would hit the cache entry for 0.0 but formats as "-0.0 B"
+    if size_bytes == 0:
+        return _format_file_size(size_bytes)
+    return _format_file_size_cached(size_bytes)
+
+
+def _format_file_size(size_bytes: int) -> str:
+    """Body of format_file_size."""
+    if not isinstance(size_bytes, int):
+        # Floats (including nan/inf) and other numerics keep the dividing loop
+        for unit in _SIZE_UNITS[:-1]:
+            if size_bytes < 1024.0:
+                return f"{size_bytes:.1f} {unit}"
+            size_bytes /= 1024.0
+        return f"{size_bytes:.1f} {_SIZE_UNITS[-1]}"
+        
+    # bit_length picks the unit directly instead of dividing in a loop
+    idx = min((max(size_bytes, 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
+
+
+# Typed so an int entry is never served for an equal float or Decimal
+_format_file_size_cached = functools.lru_cache(maxsize=1024, typed=True)(_format_file_size)
 
 
 def time_ago(date: datetime) -> str:
@@ -267,25 +466,18 @@ def time_ago(date: datetime) -> str:
     Returns:
         Human-readable time difference
     """
-    now = datetime.utcnow()
+    now = _utcnow_ttl()
     diff = now - date
     
     seconds = diff.total_seconds()
     
-    if seconds < 60:
+    idx = bisect.bisect_right(_TIME_AGO_THRESHOLDS, seconds)
+    if idx == 0:
         return "just now"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 604800:
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    else:
-        weeks = int(seconds / 604800)
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
+        
+    divisor, unit = _TIME_AGO_UNITS[idx - 1]
+    value = int(seconds / divisor)
+    return f"{value} {unit}{'s' if value != 1 else ''} ago"
 
 
 def safe_json_loads(json_str: str, default: Any = None) -> Any:
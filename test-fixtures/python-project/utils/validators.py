@@ -8,6 +8,34 @@ import re
 from typing import Optional, List, Tuple
 from datetime import datetime
 
+from utils.helpers import parse_date
+
+
+# Patterns compiled once at import time
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+_PHONE_CLEAN_RE = re.compile(r'[\s\-\(\)\+]')
+_CARD_CLEAN_RE = re.compile(r'[\s\-]')
+_HEX_COLOR_RE = re.compile(r'^#?([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$')
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE
+)
+
+# Dotted-quad IPv4 with each octet 0-255 and no leading zeros (as ipaddress does)
+_IPV4_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_IPV4_RE = re.compile(rf'{_IPV4_OCTET}\.{_IPV4_OCTET}\.{_IPV4_OCTET}\.{_IPV4_OCTET}')
+
+# C0 and C1 control characters removed by sanitize_input
+_CTRL_DELETE_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+
+# Luhn doubling (d * 2, minus 9 when above 9) as a digit-to-digit translation
+_LUHN_DOUBLED = str.maketrans('0123456789', '0246813579')
+
 
 def validate_email(email: str) -> bool:
     """
@@ -23,8 +51,7 @@ def validate_email(email: str) -> bool:
         return False
         
     # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_password(password: str, min_length: int = 8) -> bool:
@@ -41,12 +68,22 @@ def validate_password(password: str, min_length: int = 8) -> bool:
     if not password or len(password) < min_length:
         return False
         
-    # Check for at least one uppercase, one lowercase, and one digit
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    
-    return has_upper and has_lower and has_digit
+    # Check for at least one uppercase, one lowercase, and one digit in a
+    # single pass, stopping as soon as all three have been seen
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit:
+            return True
+            
+    return False
 
 
 def validate_username(username: str) -> Tuple[bool, Optional[str]]:
@@ -71,7 +108,7 @@ def validate_username(username: str) -> Tuple[bool, Optional[str]]:
     if not username[0].isalpha():
         return False, "Username must start with a letter"
         
-    if not re.match(r'^[a-zA-Z0-9_]+$', username):
+    if not _USERNAME_RE.match(username):
         return False, "Username can only contain letters, numbers, and underscores"
         
     return True, None
@@ -88,7 +125,7 @@ def validate_phone(phone: str) -> bool:
         True if phone number is valid, False otherwise
     """
     # Remove common separators
-    cleaned = re.sub(r'[\s\-\(\)\+]', '', phone)
+    cleaned = _PHONE_CLEAN_RE.sub('', phone)
     
     # Check if it's all digits and has appropriate length
     if not cleaned.isdigit():
@@ -108,15 +145,7 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL is valid, False otherwise
     """
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE
-    )
-    return bool(url_pattern.match(url))
+    return bool(_URL_RE.match(url))
 
 
 def validate_credit_card(card_number: str) -> bool:
@@ -130,31 +159,19 @@ def validate_credit_card(card_number: str) -> bool:
         True if card number is valid, False otherwise
     """
     # Remove spaces and dashes
-    card_number = re.sub(r'[\s\-]', '', card_number)
+    card_number = _CARD_CLEAN_RE.sub('', card_number)
     
-    if not card_number.isdigit():
+    if not (card_number.isascii() and card_number.isdigit()):
         return False
         
     # Check length (most cards are 13-19 digits)
     if not 13 <= len(card_number) <= 19:
         return False
         
-    # Luhn algorithm
-    def luhn_check(number: str) -> bool:
-        digits = [int(d) for d in number]
-        checksum = 0
-        
-        # Process digits from right to left
-        for i, digit in enumerate(reversed(digits[:-1])):
-            if i % 2 == 0:
-                digit *= 2
-                if digit > 9:
-                    digit -= 9
-            checksum += digit
-            
-        return (checksum + digits[-1]) % 10 == 0
-        
-    return luhn_check(card_number)
+    # Luhn algorithm: from the right, every second digit is doubled
+    digits = card_number[::-1]
+    checksum = sum(map(int, digits[::2] + digits[1::2].translate(_LUHN_DOUBLED)))
+    return checksum % 10 == 0
 
 
 def validate_date(date_str: str, format_str: str = "%Y-%m-%d") -> Tuple[bool, Optional[datetime]]:
@@ -168,11 +185,9 @@ def validate_date(date_str: str, format_str: str = "%Y-%m-%d") -> Tuple[bool, Op
     Returns:
         Tuple of (is_valid, parsed_datetime)
     """
-    try:
-        parsed_date = datetime.strptime(date_str, format_str)
-        return True, parsed_date
-    except (ValueError, TypeError):
-        return False, None
+    # parse_date carries the ISO fast path and the cached per-format parsers
+    parsed_date = parse_date(date_str, format_str)
+    return parsed_date is not None, parsed_date
 
 
 def validate_ip_address(ip: str) -> bool:
@@ -185,14 +200,7 @@ def validate_ip_address(ip: str) -> bool:
     Returns:
         True if IP is valid, False otherwise
     """
-    parts = ip.split('.')
-    if len(parts) != 4:
-        return False
-        
-    try:
-        return all(0 <= int(part) <= 255 for part in parts)
-    except ValueError:
-        return False
+    return _IPV4_RE.fullmatch(ip) is not None
 
 
 def validate_hex_color(color: str) -> bool:
@@ -206,8 +214,7 @@ def validate_hex_color(color: str) -> bool:
         True if color code is valid, False otherwise
     """
     # Accept both 3 and 6 digit hex colors with or without #
-    pattern = r'^#?([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$'
-    return bool(re.match(pattern, color))
+    return bool(_HEX_COLOR_RE.match(color))
 
 
 def sanitize_input(text: str, max_length: Optional[int] = None) -> str:
@@ -222,7 +229,7 @@ def sanitize_input(text: str, max_length: Optional[int] = None) -> str:
         Sanitized text
     """
     # Remove control characters and normalize whitespace
-    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+    text = text.translate(_CTRL_DELETE_TABLE)
     text = ' '.join(text.split())
     
     # Truncate if needed
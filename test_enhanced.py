@@ -74,6 +74,12 @@ class PostgreSQLConnection(DatabaseConnection):
         if self.connection_pool:
             self.connection_pool = None
 
+# Fields stamped onto each processed item, merged with dict |
+_USER_TAG = {'processed': True, 'type': 'user'}
+_ORDER_TAG = {'processed': True, 'type': 'order'}
+_PRODUCT_TAG = {'processed': True, 'type': 'product'}
+_GENERIC_TAG = {'processed': True, 'type': 'generic'}
+
 class DataProcessor:
     """Data processing utility with various Python patterns"""
     
@@ -84,17 +90,23 @@ class DataProcessor:
     def process_data(self, data: List[Dict[str, any]]) -> List[Dict[str, any]]:
         """Process data with complex business logic"""
         results = []
+        # Type dispatch built once per batch instead of an if/elif chain per item
+        handlers = {
+            'user': self._process_user,
+            'order': self._process_order,
+            'product': self._process_product,
+        }
+        process_generic = self._process_generic
         
         for item in data:
-            # Multiple conditional branches (increases complexity)
-            if item.get('type') == 'user':
-                processed = self._process_user(item)
-            elif item.get('type') == 'order':
-                processed = self._process_order(item)
-            elif item.get('type') == 'product':
-                processed = self._process_product(item)
+            item_type = item.get('type')
+            # Only str types can name a handler; checking first also keeps
+            # unhashable values (lists, dicts) out of the dict lookup
+            if isinstance(item_type, str):
+                handler = handlers.get(item_type, process_generic)
             else:
-                processed = self._process_generic(item)
+                handler = process_generic
+            processed = handler(item)
             
             # Nested conditions
             if processed:
@@ -111,27 +123,35 @@ class DataProcessor:
     
     async def process_data_async(self, data: List[Dict[str, any]]) -> AsyncGenerator[Dict[str, any], None]:
         """Async generator for processing data"""
-        for item in data:
-            await asyncio.sleep(0.01)  # Simulate async work
-            processed = await self._async_process_item(item)
-            if processed:
-                yield processed
+        # Start every item at once; awaiting in input order keeps results ordered
+        tasks = [asyncio.create_task(self._async_process_item(item)) for item in data]
+        try:
+            for task in tasks:
+                processed = await task
+                if processed:
+                    yield processed
+        finally:
+            # A consumer that stops early leaves tasks pending; cancel and
+            # reap them so none is destroyed pending or leaks an exception
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     def _process_user(self, user: Dict[str, any]) -> Dict[str, any]:
         """Process user data"""
-        return {**user, 'processed': True, 'type': 'user'}
+        return user | _USER_TAG
     
     def _process_order(self, order: Dict[str, any]) -> Dict[str, any]:
         """Process order data"""
-        return {**order, 'processed': True, 'type': 'order'}
+        return order | _ORDER_TAG
     
     def _process_product(self, product: Dict[str, any]) -> Dict[str, any]:
         """Process product data"""
-        return {**product, 'processed': True, 'type': 'product'}
+        return product | _PRODUCT_TAG
     
     def _process_generic(self, item: Dict[str, any]) -> Dict[str, any]:
         """Process generic data"""
-        return {**item, 'processed': True, 'type': 'generic'}
+        return item | _GENERIC_TAG
     
     def _validate_item(self, item: Dict[str, any]) -> bool:
         """Validate processed item"""
@@ -149,15 +169,17 @@ def calculate_metrics(data: List[Dict[str, any]]) -> Dict[str, float]:
     if not data:
         return {'count': 0, 'average': 0.0}
     
-    total = sum(item.get('value', 0) for item in data)
-    count = len(data)
+    # Extract values once; sum/max/min then run as C reductions over the list
+    values = [item.get('value', 0) for item in data]
+    total = sum(values)
+    count = len(values)
     
     return {
         'count': count,
         'total': total,
         'average': total / count if count > 0 else 0.0,
-        'max': max(item.get('value', 0) for item in data),
-        'min': min(item.get('value', 0) for item in data),
+        'max': max(values),
+        'min': min(values),
     }
 
 async def fetch_external_data(url: str, timeout: int = 30) -> Optional[Dict[str, any]]:
@@ -202,6 +224,9 @@ def complex_business_logic(
         return results
     
     try:
+        # Bucket items by priority in one pass, then process each bucket in one call
+        high_items = []
+        standard_items = []
         for item in input_data:
             # Pattern matching (Python 3.10+)
             match item.get('category'):
@@ -216,10 +241,25 @@ def complex_business_logic(
                 case _:
                     priority = 5
             
-            # Complex conditional logic
             if priority <= 2:
-                processor = processors.get('high_priority')
-                if processor:
+                high_items.append(item)
+            else:
+                standard_items.append(item)
+        
+        # Complex conditional logic
+        processor = processors.get('high_priority')
+        if processor and high_items:
+            # Rolled back if the batch fails, so the replay below counts each item once
+            count_before = processor._processed_count
+            try:
+                processed_items = processor.process_data(high_items)
+                results['data'].extend(processed_items)
+                results['processed'] += len(processed_items)
+                results['warnings'] += len(high_items) - len(processed_items)
+            except Exception:
+                # Fall back to per-item processing to isolate the failure
+                processor._processed_count = count_before
+                for item in high_items:
                     try:
                         processed_item = processor.process_data([item])
                         if processed_item:
@@ -230,10 +270,17 @@ def complex_business_logic(
                     except Exception as e:
                         logger.error(f"High priority processing failed: {e}")
                         results['errors'] += 1
-            else:
-                # Regular processing
-                processor = processors.get('standard')
-                if processor:
+        
+        # Regular processing
+        processor = processors.get('standard')
+        if processor and standard_items:
+            count_before = processor._processed_count
+            try:
+                results['data'].extend(processor.process_data(standard_items))
+                results['processed'] += len(standard_items)
+            except Exception:
+                processor._processed_count = count_before
+                for item in standard_items:
                     try:
                         processed_item = processor.process_data([item])
                         results['data'].extend(processed_item or [])
@@ -0,0 +1,15 @@
+"""
+Pytest configuration for the Python sample-project tests.
+
+The sample project under test-fixtures/python-project is analyzed as-is by
+Insight, so its tests live here and import it through sys.path.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+for path in (REPO_ROOT / "test-fixtures" / "python-project", REPO_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,37 @@
+"""
+Tests for DataProcessor.process_data_async in test_enhanced.
+"""
+
+import asyncio
+
+from test_enhanced import DataProcessor
+
+
+class SlowTailProcessor(DataProcessor):
+    """Processor whose items after the first stay pending for a long time."""
+    
+    async def _async_process_item(self, item):
+        await asyncio.sleep(0 if item['id'] == 0 else 60)
+        return item
+
+
+def test_process_data_async_yields_in_input_order():
+    async def collect():
+        return [item async for item in DataProcessor().process_data_async([{'id': i} for i in range(5)])]
+    
+    results = asyncio.run(collect())
+    assert [item['id'] for item in results] == list(range(5))
+    assert all(item['async_processed'] for item in results)
+
+
+def test_early_exit_reaps_pending_tasks():
+    async def consume_one():
+        stream = SlowTailProcessor().process_data_async([{'id': i} for i in range(20)])
+        async for item in stream:
+            break
+        await stream.aclose()
+        return item, {task for task in asyncio.all_tasks() if task is not asyncio.current_task()}
+    
+    first, leftover = asyncio.run(consume_one())
+    assert first['id'] == 0
+    assert leftover == set()
@@ -0,0 +1,53 @@
+"""
+Tests for complex_business_logic in test_enhanced.
+"""
+
+import logging
+
+import pytest
+
+import test_enhanced
+from test_enhanced import DEFAULT_CONFIG, DataProcessor, complex_business_logic
+
+
+class FailingProcessor(DataProcessor):
+    """Processor whose validation blows up on items marked 'explode'."""
+    
+    def _validate_item(self, item):
+        if item.get('explode'):
+            raise RuntimeError("boom")
+        return super()._validate_item(item)
+
+
+@pytest.fixture(autouse=True)
+def module_logger(monkeypatch):
+    # test_enhanced only defines its logger when run as a script
+    monkeypatch.setattr(test_enhanced, "logger", logging.getLogger("test_enhanced"), raising=False)
+
+
+@pytest.mark.parametrize("category, processor_key", [
+    ("critical", "high_priority"),
+    ("low", "standard"),
+])
+def test_failed_batch_replay_counts_each_item_once(category, processor_key):
+    items = [{'type': 'user', 'category': category, 'id': i, 'valid': True} for i in range(5)]
+    items[3]['explode'] = True
+    processor = FailingProcessor()
+    
+    results = complex_business_logic(items, DEFAULT_CONFIG, {processor_key: processor})
+    
+    assert results['errors'] == 1
+    assert results['processed'] == 4
+    assert processor._processed_count == 4
+    assert [item['id'] for item in results['data']] == [0, 1, 2, 4]
+
+
+def test_successful_batch_counts_match_results():
+    items = [{'type': 'order', 'category': c, 'valid': True} for c in ('critical', 'high', 'low', 'medium')]
+    high, standard = DataProcessor(), DataProcessor()
+    
+    results = complex_business_logic(items, DEFAULT_CONFIG, {'high_priority': high, 'standard': standard})
+    
+    assert results['processed'] == 4
+    assert (high._processed_count, standard._processed_count) == (2, 2)
+    assert results['success_rate'] == 1.0
@@ -0,0 +1,37 @@
+"""
+Tests for AppConfig in config.
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from config import AppConfig
+
+
+def test_config_round_trips_through_asdict_deepcopy_and_pickle():
+    config = AppConfig(app_name="Round Trip", features={"beta": True})
+    
+    as_dict = dataclasses.asdict(config)
+    assert as_dict["features"] == {"beta": True}
+    assert AppConfig.from_dict(as_dict) == config
+    
+    for clone in (copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+        assert clone == config
+        assert clone.get_feature("beta") is True
+        assert clone.validate() is True
+
+
+def test_invalid_config_still_raises_after_copy():
+    config = AppConfig(session_timeout=5)
+    for clone in (config, copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+        with pytest.raises(ValueError, match="Session timeout"):
+            clone.validate()
+
+
+def test_config_fields_cannot_be_reassigned():
+    config = AppConfig()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.features = {}
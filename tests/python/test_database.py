@@ -0,0 +1,51 @@
+"""
+Tests for DatabaseService in services.database.
+"""
+
+import pytest
+
+from models.product import Product
+from models.user import User
+from services.database import DatabaseService
+
+
+@pytest.fixture
+def db():
+    service = DatabaseService("sqlite:///:memory:")
+    service.connect()
+    yield service
+    service.disconnect()
+
+
+def test_execute_results_survive_later_queries(db):
+    cursor = db.execute(
+        "INSERT INTO users (username, email) VALUES (?, ?)", ("alice", "alice@example.com")
+    )
+    db.execute("INSERT INTO users (username, email) VALUES (?, ?)", ("bob", "bob@example.com"))
+    assert cursor.lastrowid == 1
+    
+    rows = db.execute("SELECT username FROM users ORDER BY user_id")
+    assert db.user_exists("bob@example.com")
+    assert [row["username"] for row in rows] == ["alice", "bob"]
+
+
+def test_save_returns_ids_of_new_rows(db):
+    assert db.save_user(User(username="alice", email="alice@example.com")) == 1
+    assert db.save_user(User(username="bob", email="bob@example.com")) == 2
+    assert db.save_product(Product("Widget", 9.99, "tools")) == 1
+    assert db.save_product(Product("Gadget", 19.99, "tools")) == 2
+    assert [p.name for p in db.get_products("tools")] == ["Widget", "Gadget"]
+
+
+def test_fetch_iter_yields_every_row_while_other_queries_run(db):
+    db.save_users([User(username=f"user{i}", email=f"user{i}@example.com") for i in range(6)])
+    
+    seen = []
+    for row in db.fetch_iter("SELECT username, email FROM users ORDER BY user_id"):
+        seen.append(row["username"])
+        assert db.fetch_one("SELECT COUNT(*) AS n FROM users")["n"] == 6
+        assert db.user_exists(row["email"])
+        db.save_product(Product(f"Item {row['username']}", 1.0, "misc"))
+        
+    assert seen == [f"user{i}" for i in range(6)]
+    assert len(db.fetch_all("SELECT * FROM products")) == 6
@@ -0,0 +1,70 @@
+"""
+Tests for the memoized formatters in utils.helpers.
+
+Each formatter is called twice per input so the second result comes from
+the cache, and both are checked against a value computed without it.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from utils.helpers import format_currency, format_date, format_file_size
+
+
+def _reference_file_size(size_bytes):
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f} PB"
+
+
+@pytest.mark.parametrize("amount, currency, expected", [
+    (1234.5, "USD", "$1,234.50"),
+    (Decimal("1234.565"), "EUR", "€1,234.56"),
+    (Decimal("0.125"), "GBP", "£0.12"),
+    (1000000, "JPY", "¥1,000,000.00"),
+    (-42.0, "CHF", "CHF -42.00"),
+])
+def test_format_currency_cached_matches_precise_value(amount, currency, expected):
+    assert format_currency(amount, currency) == expected
+    assert format_currency(amount, currency) == expected
+
+
+def test_format_currency_keeps_sign_of_zero_after_positive_zero():
+    assert format_currency(0.0) == "$0.00"
+    assert format_currency(-0.0) == "$-0.00"
+    assert format_currency(Decimal("0")) == "$0.00"
+    assert format_currency(Decimal("-0")) == "$-0.00"
+
+
+@pytest.mark.parametrize("size_bytes", [
+    0, 1, 1023, 1024, 1536, 1024 ** 2 - 1, 1024 ** 3, 5 * 1024 ** 4, 1024 ** 5, 1024 ** 6,
+    0.5, 1023.99, 2048.0, 3.7e15, float("inf"), float("nan"),
+])
+def test_format_file_size_cached_matches_dividing_loop(size_bytes):
+    expected = _reference_file_size(size_bytes)
+    assert format_file_size(size_bytes) == expected
+    assert format_file_size(size_bytes) == expected
+
+
+def test_format_file_size_keeps_sign_of_zero_after_positive_zero():
+    assert format_file_size(0.0) == "0.0 B"
+    assert format_file_size(-0.0) == "-0.0 B"
+
+
+def test_format_date_cached_matches_strftime():
+    date = datetime(2024, 2, 29, 13, 5, 9)
+    for fmt in ("%Y-%m-%d", "%d/%m/%Y %H:%M:%S"):
+        assert format_date(date, fmt) == date.strftime(fmt)
+        assert format_date(date, fmt) == date.strftime(fmt)
+
+
+def test_format_date_distinguishes_equal_instants_in_other_zones():
+    utc = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    plus_two = utc.astimezone(timezone(timedelta(hours=2)))
+    assert utc == plus_two
+    assert format_date(utc, "%H:%M %z") == "12:00 +0000"
+    assert format_date(plus_two, "%H:%M %z") == "14:00 +0200"
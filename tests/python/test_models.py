@@ -0,0 +1,79 @@
+"""
+Tests for the Product and User models.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from models.product import Product
+from models.user import User
+
+
+def test_mutator_timestamps_never_precede_creation():
+    for _ in range(200):
+        product = Product("Widget", 9.99, "tools")
+        product.update_price(10.5)
+        assert product.updated_at >= product.created_at
+        product.adjust_stock(3)
+        assert product.updated_at >= product.created_at
+        product.add_tag("sale")
+        product.set_attribute("color", "red")
+        assert product.updated_at >= product.created_at
+        
+        Product.bulk_discount([product], 10)
+        assert product.updated_at >= product.created_at
+        
+        user = User(username="alice", email="alice@example.com")
+        user.update_last_login()
+        assert user.last_login >= user.created_at
+
+
+@pytest.mark.parametrize("price, cents", [
+    (19.99, 1999), (7, 700), ("19.99", 1999), (Decimal("0.125"), 13),
+    (1.005, 101), (2.675, 268), (0.1 + 0.2, 30), (-0.005, -1),
+])
+def test_prices_are_stored_as_half_up_cents(price, cents):
+    assert Product("Widget", price, "tools")._price_cents == cents
+
+
+def test_price_reads_follow_every_update():
+    product = Product("Widget", 10, "tools")
+    assert product.price == Decimal("10.00")
+    product.update_price(12.5)
+    assert product.price == Decimal("12.50")
+    product.price = "3.333"
+    assert product.price == Decimal("3.33")
+    Product.bulk_discount([product], 50)
+    assert product.price == Decimal("1.67")
+
+
+def test_update_price_rejects_values_that_round_to_zero_from_below():
+    product = Product("Widget", 10, "tools")
+    for price in (-0.001, "-0.001", -1):
+        with pytest.raises(ValueError):
+            product.update_price(price)
+    assert product.price == Decimal("10.00")
+
+
+@pytest.mark.parametrize("price, percentage, expected", [
+    (100, 33.333, "66.67"),
+    (1000, 0.001, "999.99"),
+    (100, 0.001, "100.00"),
+    (19.99, 10, "17.99"),
+    ("0.05", 50, "0.03"),
+    (100, Decimal("12.345"), "87.66"),
+    (100, 0, "100.00"),
+    (100, 100, "0.00"),
+])
+def test_apply_discount_handles_fractional_percentages(price, percentage, expected):
+    discounted = Product("Widget", price, "tools").apply_discount(percentage)
+    assert discounted == Decimal(expected)
+    assert discounted.as_tuple().exponent == -2
+
+
+def test_bulk_discount_matches_apply_discount():
+    products = [Product("Widget", price, "tools") for price in (100, 19.99, 0.05, 1234.56)]
+    expected = [product.apply_discount(33.333) for product in products]
+    Product.bulk_discount(products, 33.333)
+    assert [product.price for product in products] == expected
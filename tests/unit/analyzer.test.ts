@@ -3,6 +3,7 @@ import fs from 'fs-extra';
 import path from 'path';
 import { ASTAnalyzer } from '../../src/core/analyzer/ASTAnalyzer.js';
 import { ErrorCollector } from '../../src/services/errors/ErrorCollector.js';
+import { CacheManager } from '../../src/services/cache/CacheManager.js';
 import type { FileInfo } from '../../src/types/index.js';
 
 describe('ASTAnalyzer', () => {
@@ -274,6 +275,46 @@ class BrokenClass
     });
   });
 
+  describe('analysis cache', () => {
+    const cacheDir = path.join(__dirname, '../temp-analysis-cache');
+
+    afterAll(async () => {
+      await fs.remove(cacheDir);
+    });
+
+    it('should reuse cached analysis for unchanged content', async () => {
+      const cachedAnalyzer = new ASTAnalyzer(undefined, new CacheManager(cacheDir));
+      const fileInfo: FileInfo = {
+        path: path.join(testDir, 'simple_class.py'),
+        size: 1000,
+        hash: 'cache-test',
+        language: 'python',
+        lastModified: new Date(),
+      };
+
+      const first = await cachedAnalyzer.analyzeFile(fileInfo);
+      const second = await cachedAnalyzer.analyzeFile(fileInfo);
+
+      expect(cachedAnalyzer.getCacheStats()).toEqual({ hits: 1, misses: 1 });
+      expect(second.functions.map(f => f.name)).toEqual(first.functions.map(f => f.name));
+      expect(second.classes.map(c => c.name)).toEqual(first.classes.map(c => c.name));
+    });
+
+    it('should not cache when no cache manager is provided', async () => {
+      const fileInfo: FileInfo = {
+        path: path.join(testDir, 'simple_class.py'),
+        size: 1000,
+        hash: 'no-cache-test',
+        language: 'python',
+        lastModified: new Date(),
+      };
+
+      await analyzer.analyzeFile(fileInfo);
+
+      expect(analyzer.getCacheStats()).toEqual({ hits: 0, misses: 0 });
+    });
+  });
+
   describe('getAnalysisStats()', () => {
     it('should calculate correct statistics', async () => {
       const fileInfo1: FileInfo = {